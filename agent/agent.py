@@ -8,9 +8,10 @@ import sys
 sys.path.append("E:\Daily_AI_Briefing_Service")
 
 # ✅ wrapping 함수 import
-from module.wrapper import News_pipeline_wrapped, Blogs_pipeline_wrapped, Paper_pipeline_wrapped, set_web_params
+from module.wrapper import News_pipeline_wrapped, Blogs_pipeline_wrapped, Paper_pipeline_wrapped, Briefing_pipeline_wrapped, set_web_params
 from function_dev.pdf_creator import export_json_to_pdf
 from function_dev.email_sender import send_email_with_pdf
+from function_dev.llm_factory import get_chat_model
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -51,10 +52,20 @@ tools = [
             "'학술 문서', '연구 자료', '논문 내용 알려줘', '논문 크롤링'."
         ),
     ),
+    StructuredTool.from_function(
+        Briefing_pipeline_wrapped,
+        name="briefing",
+        description=(
+            "뉴스·블로그·논문 파이프라인을 동시에 실행해 하나로 합친 통합 브리핑. "
+            "다음과 같은 키워드가 포함된 사용자의 요청에 대응합니다: "
+            "'브리핑', '오늘의 브리핑', '종합', '전체 요약', '뉴스 블로그 논문 모두', 'briefing'."
+        ),
+    ),
 ]
 
 # ✅ LLM 설정
-llm = ChatOpenAI(
+llm = get_chat_model(
+    ChatOpenAI,
     model="gpt-3.5-turbo",
     temperature=0,
     openai_api_key=OPENAI_API_KEY,
@@ -0,0 +1,94 @@
+import os
+import sys
+import json
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+import torch
+from transformers import (
+    BartForConditionalGeneration, PreTrainedTokenizerFast, BartTokenizer, AutoTokenizer, AutoModelForSeq2SeqLM
+)
+from benchmark.rouge_utils import make_scorer
+from function_dev.inference_backend import load_seq2seq
+from function_dev.text_chunker import split_text_into_sentences, group_sentences_by_token_limit
+from function_dev.batch_summarizer import KOBART_GENERATION_KWARGS
+from function_dev.papaer_summarizer_connector import BART_GENERATION_KWARGS, TRANSLATION_MAX_OUTPUT_LENGTH
+
+NEWS_PATH = os.path.join(BASE_DIR, "sample_news", "news_data_full.json")
+PAPER_PATH = os.path.join(BASE_DIR, "sample_papers", "arxiv_papers.json")
+
+
+def generate_all(model, tokenizer, texts, max_input_length, **generation_kwargs):
+    outputs = []
+    start = time.time()
+    for text in texts:
+        inputs = tokenizer([text], return_tensors="pt", truncation=True, max_length=max_input_length,
+                           return_token_type_ids=False)
+        with torch.no_grad():
+            ids = model.generate(**inputs, **generation_kwargs)
+        outputs.append(tokenizer.decode(ids[0], skip_special_tokens=True))
+    return outputs, time.time() - start
+
+
+def compare(name, model_name, model_cls, tokenizer, texts, backend, max_input_length, **generation_kwargs):
+    print(f"\n=== {name}: fp32 vs {backend} ({len(texts)}개 입력) ===")
+    baseline_model = load_seq2seq(model_name, model_cls, backend="torch")
+    baseline, baseline_seconds = generate_all(baseline_model, tokenizer, texts, max_input_length, **generation_kwargs)
+    del baseline_model
+
+    candidate_model = load_seq2seq(model_name, model_cls, backend=backend)
+    candidate, candidate_seconds = generate_all(candidate_model, tokenizer, texts, max_input_length, **generation_kwargs)
+    del candidate_model
+
+    scorer = make_scorer()
+    exact = sum(1 for a, b in zip(baseline, candidate) if a == b)
+    parity = [scorer.score(a, b)['rougeL'].fmeasure for a, b in zip(baseline, candidate)]
+    source_base = [scorer.score(src, out)['rouge1'].fmeasure for src, out in zip(texts, baseline)]
+    source_cand = [scorer.score(src, out)['rouge1'].fmeasure for src, out in zip(texts, candidate)]
+
+    def mean(values):
+        return sum(values) / len(values) if values else 0.0
+
+    print(f"⏱️ fp32 {baseline_seconds:.1f}초 / {backend} {candidate_seconds:.1f}초 "
+          f"(속도 향상 {baseline_seconds / max(candidate_seconds, 1e-9):.2f}x)")
+    print(f"🔁 출력 일치: {exact}/{len(texts)}, fp32 대비 ROUGE-L F1 평균 {mean(parity):.4f}")
+    print(f"📊 원문 대비 ROUGE-1 F1: fp32 {mean(source_base):.4f} / {backend} {mean(source_cand):.4f}")
+    return baseline, candidate
+
+
+def run_parity(backend="int8", news_limit=5):
+    with open(NEWS_PATH, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    with open(PAPER_PATH, "r", encoding="utf-8") as f:
+        papers = json.load(f)
+
+    # KoBART: 기사별 첫 번째 청크
+    kobart_tokenizer = PreTrainedTokenizerFast.from_pretrained('digit82/kobart-summarization')
+    news_chunks = []
+    for article in articles:
+        text = article.get("full_text", "").strip()
+        if text:
+            news_chunks.append(group_sentences_by_token_limit(split_text_into_sentences(text), kobart_tokenizer, 1024)[0])
+        if len(news_chunks) >= news_limit:
+            break
+    compare("KoBART", 'digit82/kobart-summarization', BartForConditionalGeneration, kobart_tokenizer,
+            news_chunks, backend, 1024, **KOBART_GENERATION_KWARGS)
+
+    # BART-large-CNN: 논문 본문
+    bart_tokenizer = BartTokenizer.from_pretrained("facebook/bart-large-cnn")
+    paper_texts = [paper["body"] for paper in papers if paper.get("body")]
+    baseline, _ = compare("BART-large-CNN", "facebook/bart-large-cnn", BartForConditionalGeneration, bart_tokenizer,
+                          paper_texts, backend, 1024, **BART_GENERATION_KWARGS)
+
+    # ke-t5: fp32 BART 요약 문장 번역
+    translation_model_name = "seongs/ke-t5-base-aihub-koen-translation-integrated-10m-en-to-ko"
+    translation_tokenizer = AutoTokenizer.from_pretrained(translation_model_name)
+    sentences = [s for summary in baseline for s in split_text_into_sentences(summary) if s.strip()]
+    compare("ke-t5 번역", translation_model_name, AutoModelForSeq2SeqLM, translation_tokenizer,
+            sentences, backend, 512, max_new_tokens=TRANSLATION_MAX_OUTPUT_LENGTH)
+
+
+if __name__ == "__main__":
+    run_parity(sys.argv[1] if len(sys.argv) > 1 else "int8")
@@ -0,0 +1,58 @@
+import os
+import sys
+import json
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+from transformers import PreTrainedTokenizerFast
+from function_dev.text_chunker import split_text_into_sentences, group_sentences_by_token_limit
+
+SAMPLE_PATH = os.path.join(BASE_DIR, "sample_blogs", "blogs_data.json")
+
+# ✅ 기존 구현 (그룹 전체를 문장마다 다시 토크나이즈 → 이차 시간)
+def legacy_group_sentences_by_token_limit(sentences, tokenizer, max_tokens):
+    groups = []
+    current_group = ""
+    for sentence in sentences:
+        tentative_group = current_group + " " + sentence if current_group else sentence
+        tokenized = tokenizer.encode(tentative_group)
+        if len(tokenized) <= max_tokens:
+            current_group = tentative_group
+        else:
+            if current_group:
+                groups.append(current_group.strip())
+            current_group = sentence
+    if current_group:
+        groups.append(current_group.strip())
+    return groups
+
+def run_benchmark(max_tokens=1024, repeat=3):
+    tokenizer = PreTrainedTokenizerFast.from_pretrained('digit82/kobart-summarization')
+    with open(SAMPLE_PATH, "r", encoding="utf-8") as f:
+        blogs = json.load(f)
+    texts = [blog.get("content", "") for blog in blogs if blog.get("content")]
+    sentence_lists = [split_text_into_sentences(text) for text in texts]
+    print(f"📚 블로그 {len(texts)}개, 총 {sum(len(text) for text in texts)}자, 문장 {sum(len(s) for s in sentence_lists)}개")
+
+    results = {}
+    for name, fn in [("legacy", legacy_group_sentences_by_token_limit), ("linear", group_sentences_by_token_limit)]:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            chunks = [fn(sentences, tokenizer, max_tokens) for sentences in sentence_lists]
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = (best, chunks)
+        print(f"⏱️ {name}: {best * 1000:.1f} ms, 청크 {sum(len(c) for c in chunks)}개")
+
+    # 청크 토큰 수가 한도를 넘지 않는지 확인
+    over_limit = [
+        chunk for chunks in results["linear"][1] for chunk in chunks
+        if len(tokenizer.encode(chunk)) > max_tokens and len(split_text_into_sentences(chunk)) > 1
+    ]
+    print(f"✅ 속도 향상: {results['legacy'][0] / results['linear'][0]:.1f}x, 한도 초과 청크: {len(over_limit)}개")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+
+# ✅ 외부 API 없이 샘플 데이터로 재생 (지연/오류는 OFFLINE_LATENCY_MS, OFFLINE_ERROR_RATE 등으로 조절)
+os.environ["OFFLINE_MODE"] = "1"
+# 매 실행이 같은 조건이 되도록 캐시/브리핑 기록 사용 안 함 (환경변수로 덮어쓰기 가능)
+for name, value in {
+    "HTTP_CACHE_ENABLED": "0",
+    "NEWSAPI_CACHE_ENABLED": "0",
+    "SUMMARY_CACHE_ENABLED": "0",
+    "SYNONYM_CACHE_ENABLED": "0",
+    "SEEN_MODE": "off",
+}.items():
+    os.environ.setdefault(name, value)
+
+PIPELINE_PROMPTS = [
+    "최근 2일간 AI 관련 뉴스 정리해줘",
+    "최근 3일간 AI 관련 블로그 정리해줘",
+    "최근 2일간 LLM 관련 논문 정리해줘",
+    "AI 뉴스 알려줘",  # 키워드 표현이 없어 에이전트로 넘어가는 요청
+]
+CHAT_PROMPTS = [
+    "최근 AI 뉴스에서 어떤 내용이 있었어?",
+    "오늘 AI 관련 최신 소식 검색해줘",
+]
+
+
+def run_pipeline_benchmark(prompts=PIPELINE_PROMPTS, country="Korea", synonym_range=3, runs=1):
+    import main
+
+    results = []
+    for prompt in prompts:
+        for run in range(1, runs + 1):
+            start = time.time()
+            output = None
+            for output in main.run_pipeline(prompt, country, synonym_range, ""):
+                pass
+            elapsed = time.time() - start
+            items = output.count("**") // 2 if output else 0
+            print(f"⏱️ [{run}/{runs}] {prompt}: {elapsed:.1f}초, 결과 {items}건")
+            results.append({"prompt": prompt, "run": run, "seconds": elapsed, "items": items})
+    return results
+
+
+def run_chat_benchmark(prompts=CHAT_PROMPTS, runs=1):
+    import chat
+
+    results = []
+    for prompt in prompts:
+        for run in range(1, runs + 1):
+            start = time.time()
+            _, history = chat.chat_with_agent(prompt, [])
+            elapsed = time.time() - start
+            print(f"⏱️ [{run}/{runs}] {prompt}: {elapsed:.1f}초 → {history[-1][1][:80]}")
+            results.append({"prompt": prompt, "run": run, "seconds": elapsed})
+    return results
+
+
+if __name__ == "__main__":
+    from function_dev.offline_replay import get_replay_adapter
+    from function_dev.intent_router import router_stats
+
+    pipeline_results = run_pipeline_benchmark()
+    chat_results = run_chat_benchmark()
+
+    print("\n=== 📈 오프라인 E2E ===")
+    for label, results in [("pipeline", pipeline_results), ("chat", chat_results)]:
+        if results:
+            total = sum(result["seconds"] for result in results)
+            print(f"{label:>8}: {len(results)}회, 총 {total:.1f}초, 평균 {total / len(results):.1f}초")
+    stats = router_stats()
+    print(f"🧭 빠른 경로 적중률: {stats['fast']}/{stats['total']} ({stats['hit_rate']:.0%})")
+    print(f"🔌 재생 요청 통계: {get_replay_adapter().stats}")
@@ -0,0 +1,10 @@
+from rouge_score import rouge_scorer
+
+# ✅ 기본 토크나이저는 영문/숫자 외 문자를 지우므로 한국어 비교용 공백 토크나이저 사용
+class WhitespaceTokenizer:
+    def tokenize(self, text):
+        return text.split()
+
+
+def make_scorer(metrics=('rouge1', 'rouge2', 'rougeL')):
+    return rouge_scorer.RougeScorer(list(metrics), tokenizer=WhitespaceTokenizer())
@@ -0,0 +1,78 @@
+import os
+import sys
+import json
+import time
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BASE_DIR)
+os.environ["SUMMARY_CACHE_ENABLED"] = "0"   # 캐시 적중 없이 순수 생성 시간만 측정
+
+from benchmark.rouge_utils import make_scorer
+from function_dev.batch_summarizer import batch_hierarchical_summary, GENERATION_STATS
+
+SAMPLE_PATH = os.path.join(BASE_DIR, "sample_news", "news_data_full.json")
+REFERENCE_PATH = os.path.join(BASE_DIR, "sample_news", "news_data_summaries.json")   # 기존 요약 결과 (URL 기준 매칭)
+
+def run_benchmark(keyword="인공지능", limit=None):
+    with open(SAMPLE_PATH, "r", encoding="utf-8") as f:
+        articles = json.load(f)
+    with open(REFERENCE_PATH, "r", encoding="utf-8") as f:
+        references = {item["url"]: item["summary"] for item in json.load(f) if item.get("summary")}
+
+    # 기준 요약이 있는 기사만 비교
+    pairs = [
+        (article["full_text"].strip(), references[article["url"]])
+        for article in articles if article.get("full_text", "").strip() and article.get("url") in references
+    ]
+    pairs = pairs[:limit] if limit else pairs
+    texts = [text for text, _ in pairs]
+    print(f"📚 기사 {len(texts)}개, 총 {sum(len(text) for text in texts)}자 (기준 요약: {REFERENCE_PATH})")
+
+    scorer = make_scorer()
+    results = {}
+    outputs = {}
+    for mode in ["hierarchical", "extractive"]:
+        GENERATION_STATS["chunks"], GENERATION_STATS["seconds"] = 0, 0.0
+        start = time.time()
+        summaries = batch_hierarchical_summary(texts, keyword, post_check=False, mode=mode)
+        elapsed = time.time() - start
+
+        outputs[mode] = summaries
+
+        # 원문이 아니라 기준 요약과 비교해야 요약 품질 차이가 드러남
+        scores = [scorer.score(reference, summary) for (_, reference), summary in zip(pairs, summaries) if summary]
+        results[mode] = {
+            "seconds": elapsed,
+            "generated_chunks": GENERATION_STATS["chunks"],
+            **{
+                metric: sum(score[metric].fmeasure for score in scores) / len(scores) if scores else 0.0
+                for metric in ['rouge1', 'rouge2', 'rougeL']
+            }
+        }
+
+    # 추출 압축 결과가 계층 요약 결과와 얼마나 같은지 (품질 손실 정도)
+    agreement = [
+        scorer.score(hierarchical, extractive)
+        for hierarchical, extractive in zip(outputs["hierarchical"], outputs["extractive"]) if hierarchical and extractive
+    ]
+    results["agreement"] = {
+        metric: sum(score[metric].fmeasure for score in agreement) / len(agreement) if agreement else 0.0
+        for metric in ['rouge1', 'rouge2', 'rougeL']
+    }
+
+    print("\n=== 📈 요약 모드 비교 (기준 요약 대비 ROUGE) ===")
+    for mode in ["hierarchical", "extractive"]:
+        values = results[mode]
+        print(
+            f"{mode:>12}: {values['seconds']:.1f}초, 생성 청크 {values['generated_chunks']}개, "
+            f"ROUGE-1 F1 {values['rouge1']:.4f}, ROUGE-2 F1 {values['rouge2']:.4f}, ROUGE-L F1 {values['rougeL']:.4f}"
+        )
+    print(
+        f"{'계층 vs 추출':>12}: ROUGE-1 F1 {results['agreement']['rouge1']:.4f}, "
+        f"ROUGE-2 F1 {results['agreement']['rouge2']:.4f}, ROUGE-L F1 {results['agreement']['rougeL']:.4f}"
+    )
+    print(f"⏱️ 속도 향상: {results['hierarchical']['seconds'] / max(results['extractive']['seconds'], 1e-9):.1f}x")
+    return results
+
+if __name__ == "__main__":
+    run_benchmark()
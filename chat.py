@@ -8,8 +8,10 @@ from langchain.docstore.document import Document
 from langchain.chains import RetrievalQA
 from langchain.agents import Tool, initialize_agent, AgentType
 from langchain.chat_models import ChatOpenAI
-import requests
 import gradio as gr
+from function_dev.http_client import fetch
+from function_dev.offline_replay import OFFLINE_MODE
+from function_dev.llm_factory import get_chat_model, complete_chat
 
 # 🔍 SerpAPI 대체 GoogleSearch 클래스
 class GoogleSearch:
@@ -18,7 +20,7 @@ class GoogleSearch:
         self.api_key = params.get("api_key")
 
     def get_dict(self):
-        response = requests.get("https://serpapi.com/search", params=self.params)
+        response = fetch("https://serpapi.com/search", polite=False, params=self.params)
         response.raise_for_status()
         return response.json()
 
@@ -26,7 +28,7 @@ class GoogleSearch:
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = None if OFFLINE_MODE else OpenAI(api_key=OPENAI_API_KEY)
 
 # 📚 벡터DB 로딩
 base_path = os.path.dirname(__file__)
@@ -50,7 +52,7 @@ def filtered_rag_run(query: str, source_filter: str) -> str:
     local_retriever = local_vectordb.as_retriever(search_type="mmr", search_kwargs={"k": 3})
     rag_chain = RetrievalQA.from_chain_type(
         retriever=local_retriever,
-        llm=ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0.3),
+        llm=get_chat_model(ChatOpenAI, model_name="gpt-3.5-turbo", temperature=0.3),
         return_source_documents=False
     )
     docs = local_retriever.get_relevant_documents(query)
@@ -67,12 +69,7 @@ def run_summary_tool(text: str) -> str:
         )},
         {"role": "user", "content": f"{text}"}
     ]
-    response = client.chat.completions.create(
-        model="gpt-3.5-turbo",
-        messages=messages,
-        temperature=0.1
-    )
-    return response.choices[0].message.content
+    return complete_chat(client, messages, model="gpt-3.5-turbo", temperature=0.1)
 
 # 🌍 웹 검색 툴
 def search_web_tool(query: str) -> str:
@@ -106,7 +103,7 @@ tools = [
 # 🧠 에이전트 초기화
 agent = initialize_agent(
     tools=tools,
-    llm=ChatOpenAI(model_name="gpt-3.5-turbo", temperature=0.3),
+    llm=get_chat_model(ChatOpenAI, model_name="gpt-3.5-turbo", temperature=0.3),
     agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION,
     handle_parsing_errors=True,
     verbose=True
@@ -1,15 +1,108 @@
 # agents/data_fetcher.py
 
-import requests
-from dotenv import load_dotenv
 import os
+import json
+import time
+import hashlib
+import tempfile
 from datetime import datetime, timedelta
-from urllib.parse import quote
+from dotenv import load_dotenv
+from function_dev.http_client import fetch, get_fetch_executor
+from function_dev.cache_paths import cache_path, CACHE_DIR
 
 # .env 로드
 load_dotenv()
 
 NEWS_API_KEY = os.getenv("NEWS_API_KEY")
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+NEWSAPI_MAX_QUERY_LENGTH = 500   # NewsAPI q 파라미터 최대 길이
+NEWSAPI_PAGE_SIZE = 100
+NEWSAPI_CACHE_ENABLED = os.getenv("NEWSAPI_CACHE_ENABLED", "1") == "1"
+NEWSAPI_CACHE_MAX_AGE_DAYS = float(os.getenv("NEWSAPI_CACHE_MAX_AGE_DAYS", "1"))   # 키에 날짜가 들어가므로 하루 지나면 쓰이지 않음
+
+# ✅ 동의어를 OR 쿼리로 묶기 (쿼리 길이 제한 이내에서 최대한 적은 요청으로)
+def plan_newsapi_queries(keywords, max_length=NEWSAPI_MAX_QUERY_LENGTH):
+    queries = []
+    current = ""
+    for keyword in dict.fromkeys(k.strip() for k in keywords if k.strip()):
+        term = f'"{keyword}"' if " " in keyword else keyword
+        tentative = f"{current} OR {term}" if current else term
+        if len(tentative) <= max_length:
+            current = tentative
+        else:
+            if current:
+                queries.append(current)
+            current = term
+    if current:
+        queries.append(current)
+    return queries
+
+# ✅ 하루 단위 응답 캐시: (쿼리, 기간, 오늘 날짜) 기준
+def _newsapi_cache_file(query, day):
+    today = datetime.utcnow().strftime('%Y-%m-%d')
+    key = hashlib.sha256(f"{query}\x00{day}\x00{today}".encode("utf-8")).hexdigest()
+    return cache_path("newsapi", f"{key}.json")
+
+# ✅ 보관 기간이 지난 캐시 파일 삭제
+def evict_newsapi_cache(max_age_days=NEWSAPI_CACHE_MAX_AGE_DAYS):
+    directory = os.path.join(CACHE_DIR, "newsapi")
+    if not os.path.isdir(directory):
+        return 0
+    cutoff = time.time() - max_age_days * 86400
+    removed = 0
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except OSError:
+            pass
+    if removed:
+        print(f"🧹 뉴스 검색 캐시 정리: {removed}건 삭제")
+    return removed
+
+def _search_newsapi(query, day, from_date_str, to_date_str):
+    cache_file = _newsapi_cache_file(query, day)
+    if NEWSAPI_CACHE_ENABLED and os.path.exists(cache_file):
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                articles = json.load(f)
+            print(f"💾 '{query}' 오늘 검색 결과 캐시 사용")
+            return articles
+        except (OSError, ValueError):
+            pass
+
+    response = fetch(NEWSAPI_URL, polite=False, params={
+        "q": query,
+        "from": from_date_str,
+        "to": to_date_str,
+        "language": "ko",
+        "sortBy": "publishedAt",
+        "pageSize": NEWSAPI_PAGE_SIZE,
+        "page": 1,
+        "apiKey": NEWS_API_KEY
+    })
+    if response.status_code != 200:
+        print(f"❌ '{query}' 검색 실패: {response.status_code}")
+        try:
+            print(f"↪️ 오류 내용: {response.json()}")
+        except:
+            pass
+        return None
+
+    articles = response.json().get("articles", [])
+    if NEWSAPI_CACHE_ENABLED:
+        # 쓰는 도중 중단돼도 깨진 파일이 남지 않도록 임시 파일에 쓴 뒤 교체
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(articles, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_file)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    return articles
 
 def fetch_data_newsapi(keywords, day=1):
     day = int(day)
@@ -26,51 +119,36 @@ def fetch_data_newsapi(keywords, day=1):
 
     print(f"\n📅 수집 기간: {from_date_str} ~ {to_date_str}")
 
-    for keyword in keywords:
-        print(f"\n🔎 '{keyword}'로 뉴스 검색 중...")
-        encoded_keyword = quote(keyword)
-        url = (
-            f"https://newsapi.org/v2/everything?"
-            f"q={encoded_keyword}&"
-            f"from={from_date_str}&"
-            f"to={to_date_str}&"
-            f"language=ko&"
-            f"sortBy=publishedAt&"
-            f"apiKey={NEWS_API_KEY}"
-        )
-        response = requests.get(url)
-        if response.status_code == 200:
-            data = response.json()
-            articles = data.get("articles", [])
-            for article in articles:
-                title = article.get('title', '').strip()
-                description = article.get('description', '').strip()
-                url = article.get('url', '').strip()
-                source = article.get('source', {}).get('name', '').strip()
-
-                # 중복 기사 방지 (title 기준)
-                if title and title not in seen_titles:
-                    seen_titles.add(title)
-                    all_articles.append({
-                        "title": title,
-                        "url": url,
-                        "source": source,
-                        "publishedAt": article.get('publishedAt', '')
-                    })
-            print(f"✅ '{keyword}' 결과: {len(articles)}건")
-        else:
-            print(f"❌ '{keyword}' 검색 실패: {response.status_code}")
-            try:
-                print(f"↪️ 오류 내용: {response.json()}")
-            except:
-                pass
+    if NEWSAPI_CACHE_ENABLED:
+        evict_newsapi_cache()
+    queries = plan_newsapi_queries(keywords)
+    print(f"\n🔎 동의어 {len(keywords)}개 → 쿼리 {len(queries)}개로 뉴스 검색 중...")
+    results = list(get_fetch_executor().map(lambda q: _search_newsapi(q, day, from_date_str, to_date_str), queries))
+
+    for query, articles in zip(queries, results):
+        if articles is None:
+            continue
+        for article in articles:
+            title = (article.get('title') or '').strip()
+            url = (article.get('url') or '').strip()
+            source = ((article.get('source') or {}).get('name') or '').strip()
+
+            # 중복 기사 방지 (title 기준)
+            if title and title not in seen_titles:
+                seen_titles.add(title)
+                all_articles.append({
+                    "title": title,
+                    "url": url,
+                    "source": source,
+                    "description": (article.get('description') or '').strip(),
+                    "publishedAt": article.get('publishedAt', '')
+                })
+        print(f"✅ '{query}' 결과: {len(articles)}건")
 
     print(f"\n📰 총 수집된 고유 기사 수: {len(all_articles)}개")
     return all_articles
 
 
-import json
-
 if __name__ == "__main__":
     news = fetch_data_newsapi(['인공지능', 'AI', '인공신경망', '머신러닝', '딥러닝'], 2)
 
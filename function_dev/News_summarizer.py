@@ -1,41 +1,12 @@
-import torch
-from transformers import BartForConditionalGeneration, PreTrainedTokenizerFast
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import util
+from function_dev.model_registry import get_model, device
+from function_dev.text_chunker import split_text_into_sentences, group_sentences_by_token_limit
 
-# ✅ 디바이스 설정
-device = "cuda" if torch.cuda.is_available() else "cpu"
-
-# ✅ KoBART 모델 로드
-kobart_model = BartForConditionalGeneration.from_pretrained('digit82/kobart-summarization').to(device)
-kobart_tokenizer = PreTrainedTokenizerFast.from_pretrained('digit82/kobart-summarization')
-
-# ✅ 임베딩 모델 로드
-embedder = SentenceTransformer("sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
-
-# ✅ 문장 단위 분할
-def split_text_into_sentences(text):
-    import re
-    return re.split(r'(?<=[.!?])\s+', text)
-
-# ✅ 문장 토큰 기준 그룹화
-def group_sentences_by_token_limit(sentences, tokenizer, max_tokens):
-    groups = []
-    current_group = ""
-    for sentence in sentences:
-        tentative_group = current_group + " " + sentence if current_group else sentence
-        tokenized = tokenizer.encode(tentative_group, return_tensors="pt")
-        if tokenized.size(1) <= max_tokens:
-            current_group = tentative_group
-        else:
-            if current_group:
-                groups.append(current_group.strip())
-            current_group = sentence
-    if current_group:
-        groups.append(current_group.strip())
-    return groups
+# ✅ KoBART / 임베딩 모델은 model_registry에서 첫 사용 시 로드 (모듈 간 공유)
 
 # ✅ 요약 함수
 def summarize_kobart(text, max_input_length=1024, max_output_length=700):
+    kobart_model, kobart_tokenizer = get_model("kobart")
     inputs = kobart_tokenizer.encode(text, return_tensors="pt", max_length=max_input_length, truncation=True).to(device)
     summary_ids = kobart_model.generate(
         inputs,
@@ -51,6 +22,7 @@ def summarize_kobart(text, max_input_length=1024, max_output_length=700):
 
 # ✅ 유사도 필터 함수
 def is_relevant(summary: str, keyword: str, threshold=0.1) -> bool:
+    embedder = get_model("embedder")
     embeddings = embedder.encode([summary, keyword])
     similarity = util.cos_sim(embeddings[0], embeddings[1]).item()
     print(f"    🔍 유사도 점수: {similarity:.4f} (키워드: {keyword})")
@@ -58,6 +30,7 @@ def is_relevant(summary: str, keyword: str, threshold=0.1) -> bool:
 
 # ✅ 계층적 요약 함수 (코사인 유사도 포함, 중복 제거 X)
 def hierarchical_summary(full_text, keyword=None, max_input_length=1024):
+    _, kobart_tokenizer = get_model("kobart")
     sentences = split_text_into_sentences(full_text)
     text_chunks = group_sentences_by_token_limit(sentences, kobart_tokenizer, max_input_length)
     chunk_summaries = []
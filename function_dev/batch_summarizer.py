@@ -0,0 +1,188 @@
+import os
+import math
+import time
+from function_dev.model_registry import get_model, run_model, device
+from function_dev.inference_backend import model_cache_name
+from function_dev.News_summarizer import is_relevant
+from function_dev.text_chunker import split_text_into_sentences, group_sentences_by_token_limit
+from function_dev.extractive_compressor import compress_to_token_budget
+from function_dev.summary_cache import make_cache_key, get_cached_summary, put_cached_summary
+
+KOBART_MODEL_NAME = "digit82/kobart-summarization"
+
+# ✅ 배치 설정 (CPU 기준)
+KOBART_BATCH_SIZE = 8
+
+# ✅ 요약 모드: "hierarchical"(청크별 요약 → 재요약) | "extractive"(추출 압축 후 1회 요약)
+SUMMARY_MODE = os.getenv("SUMMARY_MODE", "hierarchical")
+
+# ✅ 생성 파라미터 (summarize_kobart와 동일)
+KOBART_GENERATION_KWARGS = dict(
+    max_length=700,
+    min_length=100,
+    num_beams=4,
+    no_repeat_ngram_size=3,
+    repetition_penalty=2.0,
+    length_penalty=1.0,
+    early_stopping=False
+)
+
+# ✅ 생성 시간 통계 (사전 필터의 절약 시간 추정용)
+GENERATION_STATS = {"chunks": 0, "seconds": 0.0}
+DEFAULT_SECONDS_PER_CHUNK = 10.0
+CHARS_PER_CHUNK = 1500
+
+def estimate_generation_seconds(text):
+    chunks = max(1, math.ceil(len(text or "") / CHARS_PER_CHUNK))
+    generations = chunks + (1 if chunks > 1 else 0)
+    if GENERATION_STATS["chunks"]:
+        per_chunk = GENERATION_STATS["seconds"] / GENERATION_STATS["chunks"]
+    else:
+        per_chunk = DEFAULT_SECONDS_PER_CHUNK
+    return generations * per_chunk
+
+# ✅ 토큰 길이 기준 버킷팅 (패딩 최소화)
+def bucket_by_token_length(token_lengths, batch_size):
+    order = sorted(range(len(token_lengths)), key=lambda i: token_lengths[i])
+    return [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+# ✅ 배치 요약 함수
+def summarize_kobart_batch(texts, max_input_length=1024, batch_size=KOBART_BATCH_SIZE):
+    if not texts:
+        return []
+    kobart_model, kobart_tokenizer = get_model("kobart")
+
+    token_lengths = [
+        min(len(kobart_tokenizer.encode(text)), max_input_length) for text in texts
+    ]
+    summaries = [None] * len(texts)
+
+    for b, indices in enumerate(bucket_by_token_length(token_lengths, batch_size), 1):
+        batch_texts = [texts[i] for i in indices]
+        print(f"⚙️ 배치 {b}: {len(batch_texts)}개 청크 (최대 {max(token_lengths[i] for i in indices)} 토큰)")
+        inputs = kobart_tokenizer(
+            batch_texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=max_input_length,
+            return_token_type_ids=False
+        ).to(device)
+
+        def generate():
+            # 실행기 대기 시간은 제외하고 생성 시간만 기록
+            start = time.time()
+            summary_ids = kobart_model.generate(
+                input_ids=inputs["input_ids"],
+                attention_mask=inputs["attention_mask"],
+                **KOBART_GENERATION_KWARGS
+            )
+            GENERATION_STATS["chunks"] += len(batch_texts)
+            GENERATION_STATS["seconds"] += time.time() - start
+            return summary_ids
+
+        summary_ids = run_model(generate)
+
+        decoded = kobart_tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+        for i, summary in zip(indices, decoded):
+            summaries[i] = summary
+
+    return summaries
+
+# ✅ 기사 여러 개를 한 번에 계층적 요약 (hierarchical_summary와 동일한 단계)
+def batch_hierarchical_summary(full_texts, keywords=None, max_input_length=1024, threshold=0.1, post_check=True,
+                               mode=None):
+    """
+    여러 기사의 청크를 모아 배치 단위로 요약한 뒤, 기사별 계층적 요약 결과로 다시 조립합니다.
+    mode="extractive"이면 기사마다 추출 압축으로 한 윈도우에 맞춘 뒤 KoBART를 한 번만 실행합니다.
+    keywords는 단일 키워드 또는 기사별 키워드 리스트이며, 결과는 full_texts와 같은 순서의 리스트입니다.
+    (post_check=True이면 요약 후 유사도 검사, 기준 미달 기사는 None)
+    """
+    if keywords is None or isinstance(keywords, str):
+        keywords = [keywords] * len(full_texts)
+    _, kobart_tokenizer = get_model("kobart")
+
+    # 기사별 상태: stage("chunks" | "final"), depth(재분할 횟수), inputs(이번 라운드 요약 입력)
+    mode = mode or SUMMARY_MODE
+    cache_params = dict(KOBART_GENERATION_KWARGS, max_input_length=max_input_length)
+    if mode != "hierarchical":
+        cache_params["mode"] = mode
+    states = []
+    for full_text, keyword in zip(full_texts, keywords):
+        # 추출 압축은 키워드에 따라 입력이 달라지므로 키워드도 캐시 키에 포함
+        article_params = dict(cache_params, keyword=keyword) if mode == "extractive" else cache_params
+        cache_key = make_cache_key(full_text, model_cache_name(KOBART_MODEL_NAME), article_params)
+        cached = get_cached_summary(cache_key)
+        if cached is not None:
+            # ✅ 캐시 적중 → 생성 생략
+            states.append({"stage": "final", "depth": 0, "inputs": [], "final": cached["summary"],
+                           "chunk_summaries": cached["chunk_summaries"], "cache_key": cache_key, "cached": True})
+            continue
+        if mode == "extractive":
+            compressed = compress_to_token_budget(full_text, kobart_tokenizer, keyword, max_input_length)
+            states.append({"stage": "final", "depth": 0, "inputs": [compressed], "final": None,
+                           "chunk_summaries": [], "cache_key": cache_key, "cached": False})
+            continue
+        sentences = split_text_into_sentences(full_text)
+        chunks = group_sentences_by_token_limit(sentences, kobart_tokenizer, max_input_length)
+        states.append({"stage": "chunks", "depth": 0, "inputs": chunks, "final": None,
+                       "chunk_summaries": None, "cache_key": cache_key, "cached": False})
+
+    cache_hits = sum(1 for state in states if state["cached"])
+    if cache_hits:
+        print(f"💾 요약 캐시 적중: {cache_hits}/{len(states)}개 기사")
+
+    round_idx = 0
+    while True:
+        pending = [idx for idx, state in enumerate(states) if state["final"] is None and state["inputs"]]
+        if not pending:
+            break
+        round_idx += 1
+
+        jobs = [(idx, text) for idx in pending for text in states[idx]["inputs"]]
+        print(f"🧩 라운드 {round_idx}: 기사 {len(pending)}개, 청크 {len(jobs)}개 배치 요약 중...")
+        outputs = summarize_kobart_batch([text for _, text in jobs], max_input_length)
+
+        results = {idx: [] for idx in pending}
+        for (idx, _), summary in zip(jobs, outputs):
+            results[idx].append(summary)
+
+        for idx, summaries in results.items():
+            state = states[idx]
+            if state["chunk_summaries"] is None:
+                state["chunk_summaries"] = summaries
+
+            if state["stage"] == "final" or (state["depth"] == 0 and len(summaries) == 1):
+                # ✅ 최종 요약 또는 청크 1개 → 추가 요약 없이 반환
+                state["final"] = summaries[0]
+                continue
+
+            combined_summary = " ".join(summaries)
+            combined_token_count = len(kobart_tokenizer.encode(combined_summary))
+
+            if combined_token_count <= max_input_length:
+                state["stage"], state["inputs"] = "final", [combined_summary]
+            elif state["depth"] == 0:
+                print(f"⚠️ [{idx + 1}] combined summary 길이 초과 ({combined_token_count}) → 다시 나누기")
+                new_sentences = split_text_into_sentences(combined_summary)
+                state["depth"] = 1
+                state["inputs"] = group_sentences_by_token_limit(new_sentences, kobart_tokenizer, max_input_length)
+            else:
+                print(f"⚠️ [{idx + 1}] 재분할된 combined summary도 입력 초과 → 그대로 사용")
+                state["final"] = combined_summary
+
+    final_summaries = []
+    for state, keyword in zip(states, keywords):
+        final_summary = state["final"]
+        if final_summary is None:
+            final_summaries.append(None)
+            continue
+        if not state["cached"]:
+            put_cached_summary(state["cache_key"], model_cache_name(KOBART_MODEL_NAME), final_summary, state["chunk_summaries"])
+        if post_check and keyword and not is_relevant(final_summary, keyword, threshold):
+            print(f"⛔️ 유사도 기준 미달 → 요약 제외")
+            final_summaries.append(None)
+            continue
+        final_summaries.append(final_summary.replace('\n', ' '))
+
+    return final_summaries
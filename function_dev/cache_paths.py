@@ -0,0 +1,11 @@
+import os
+
+# ✅ 캐시 저장 위치 (기본: 프로젝트 루트의 cache/)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.getenv("DABS_CACHE_DIR", os.path.join(BASE_DIR, "cache"))
+
+
+def cache_path(*parts):
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
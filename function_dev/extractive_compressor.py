@@ -0,0 +1,81 @@
+import re
+import torch
+from sentence_transformers import util
+from function_dev.model_registry import get_model
+from function_dev.text_chunker import split_text_into_sentences, count_sentence_tokens
+
+# ✅ 문장 선택 (MMR: 키워드 관련성 vs 이미 고른 문장과의 중복)
+def select_sentences(embeddings, token_counts, budget, keyword_embedding=None, method="mmr", diversity=0.3):
+    similarity = util.cos_sim(embeddings, embeddings)
+    centrality = similarity.mean(dim=1)
+    if method == "mmr" and keyword_embedding is not None:
+        relevance = util.cos_sim(embeddings, keyword_embedding).squeeze(1)
+    else:
+        relevance = centrality
+
+    counts = torch.tensor(token_counts, device=relevance.device)
+    available = torch.ones(len(token_counts), dtype=torch.bool, device=relevance.device)
+    # 후보별로 이미 고른 문장과의 최대 유사도를 누적해 두고 한 번에 점수 계산
+    redundancy = torch.full_like(relevance, float("-inf"))
+    selected = []
+    used = 0
+    while True:
+        candidates = available & (counts + used <= budget)
+        if not candidates.any():
+            break
+        score = relevance
+        if method == "mmr" and selected:
+            score = (1 - diversity) * relevance - diversity * redundancy
+        best = int(torch.where(candidates, score, torch.full_like(score, float("-inf"))).argmax())
+        selected.append(best)
+        used += token_counts[best]
+        available[best] = False
+        redundancy = torch.maximum(redundancy, similarity[best])
+    return sorted(selected)
+
+# ✅ 예산보다 긴 문장(마침표 없는 긴 한국어 문단 등)은 줄바꿈·쉼표 단위로 나누고, 그래도 길면 예산에 맞게 자름
+def _split_long_sentences(sentences, token_counts, tokenizer, budget):
+    pieces = []
+    for sentence, count in zip(sentences, token_counts):
+        if count <= budget:
+            pieces.append(sentence)
+            continue
+        for part in re.split(r"\n+|(?<=[,，、])\s*", sentence):
+            part = part.strip()
+            if not part:
+                continue
+            ids = tokenizer(" " + part, add_special_tokens=False)["input_ids"]
+            if len(ids) > budget:
+                # 디코딩 후 다시 토크나이즈하면 길이가 조금 달라질 수 있어 여유를 둠
+                part = tokenizer.decode(ids[:int(budget * 0.9)], skip_special_tokens=True).strip()
+            pieces.append(part)
+    return pieces
+
+# ✅ 추출 요약으로 1024 토큰 윈도우 하나에 맞게 압축
+def compress_to_token_budget(text, tokenizer, keyword=None, max_tokens=1024, method="mmr"):
+    """
+    문장 임베딩으로 중심성(centrality) 또는 키워드 기준 MMR 점수를 매겨
+    max_tokens 안에 들어가는 문장만 원래 순서대로 골라 반환합니다.
+    입력이 비어 있지 않으면 결과도 비어 있지 않습니다.
+    """
+    sentences = [sentence for sentence in split_text_into_sentences(text) if sentence.strip()]
+    token_counts = count_sentence_tokens(sentences, tokenizer)
+    budget = max_tokens - tokenizer.num_special_tokens_to_add()
+    if sum(token_counts) <= budget:
+        return " ".join(sentences)
+
+    if any(count > budget for count in token_counts):
+        sentences = _split_long_sentences(sentences, token_counts, tokenizer, budget)
+        token_counts = count_sentence_tokens(sentences, tokenizer)
+
+    embedder = get_model("embedder")
+    embeddings = embedder.encode(sentences, batch_size=64, convert_to_tensor=True)
+    keyword_embedding = embedder.encode([keyword], convert_to_tensor=True) if keyword else None
+
+    selected = select_sentences(embeddings, token_counts, budget, keyword_embedding, method)
+    if not selected:
+        # 모든 조각이 예산을 넘는 경우: 첫 조각을 예산에 맞게 잘라 사용
+        ids = tokenizer(" " + sentences[0], add_special_tokens=False)["input_ids"]
+        return tokenizer.decode(ids[:budget], skip_special_tokens=True).strip()
+    print(f"✂️ 추출 압축: 문장 {len(sentences)}개 → {len(selected)}개 ({sum(token_counts)} → {sum(token_counts[i] for i in selected)} 토큰)")
+    return " ".join(sentences[i] for i in selected)
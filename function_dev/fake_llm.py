@@ -0,0 +1,153 @@
+import os
+import re
+import ast
+import json
+import time
+from typing import Any, List, Optional
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, FunctionMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from function_dev.synonym_lexicon import lookup_synonyms
+from function_dev.intent_router import PHRASE_TIME_TOKEN, parse_days, parse_keyword
+
+# ✅ 오프라인 벤치마크용 가짜 챗 모델 설정
+OFFLINE_LLM_LATENCY_MS = float(os.getenv("OFFLINE_LLM_LATENCY_MS", "0"))
+
+# 툴 이름/설명에 포함된 단어 → 사용자 요청에 포함될 때 선택
+TOOL_HINTS = {
+    "briefing": ["브리핑", "종합", "briefing"],
+    "news": ["뉴스", "기사", "보도", "news"],
+    "blog": ["블로그", "blog"],
+    "paper": ["논문", "학술", "paper", "research"],
+    "web_search": ["검색", "최신", "search"],
+}
+SECTION_LABELS = {"news": "📰 뉴스", "blog": "📝 블로그", "paper": "📚 논문"}
+REFUSAL = "죄송합니다. 현재 뉴스, 블로그, 논문에 대한 요청만 처리할 수 있습니다."
+
+
+def _text(message):
+    return message.content if isinstance(message.content, str) else json.dumps(message.content, ensure_ascii=False)
+
+
+def _split_list(text):
+    return [word.strip() for word in text.split(",") if word.strip()]
+
+
+def _pick_tool(request, tool_names):
+    lowered = request.lower()
+    for hint_key, hints in TOOL_HINTS.items():
+        if any(hint in lowered for hint in hints):
+            tool = next((tool for tool in tool_names if hint_key in tool.lower()), None)
+            if tool:
+                return tool
+    return None
+
+
+# ✅ "최근 3일간 AI 관련 뉴스" → ("AI", 3)
+# ✅ 기간·키워드는 빠른 경로 라우터와 같은 규칙으로 해석 (오프라인 재현이 실제 라우팅과 어긋나지 않도록)
+def parse_request(request):
+    days = parse_days(request) or 1
+    keyword = parse_keyword(request)
+    if not keyword:
+        stopwords = {"최근", "오늘", "뉴스", "블로그", "논문", "정리해줘", "요약해줘", "알려줘"}
+        words = [w for w in re.findall(r"[\w\-]+", re.sub(PHRASE_TIME_TOKEN, " ", request)) if w not in stopwords]
+        keyword = words[0] if words else "AI"
+    return keyword, days
+
+
+def _format_results(content):
+    try:
+        items = json.loads(content)
+    except (TypeError, ValueError):
+        try:
+            items = ast.literal_eval(content)
+        except (ValueError, SyntaxError):
+            return content
+    if not isinstance(items, list) or not items:
+        return "관련 자료를 찾지 못했습니다."
+    blocks = []
+    current_source = None
+    for item in items:
+        # 통합 브리핑 결과는 소스가 바뀔 때마다 섹션 제목 추가
+        if item.get("source") and item["source"] != current_source:
+            current_source = item["source"]
+            blocks.append(f"### {SECTION_LABELS.get(current_source, current_source)}")
+        blocks.append(f"**{item.get('title', '')}** ({item.get('url', '')})\n- {item.get('summary', '')}")
+    return "\n\n".join(blocks)
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    OpenAI 호출 없이 프롬프트 형태만 보고 결정적인 응답을 돌려주는 챗 모델입니다.
+    동의어 생성/검수/정렬, OpenAI functions 에이전트의 툴 선택, ReAct 에이전트, RetrievalQA 프롬프트를 처리합니다.
+    """
+
+    model_name: str = "fake-chat"
+    temperature: float = 0.0
+    latency_ms: float = OFFLINE_LLM_LATENCY_MS
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager: Any = None,
+                  **kwargs: Any) -> ChatResult:
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        message = self._respond(messages, kwargs.get("functions") or kwargs.get("tools"))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _respond(self, messages, functions):
+        if functions:
+            return self._function_call(messages, functions)
+        prompt = "\n".join(_text(m) for m in messages)
+        return AIMessage(content=self._complete(prompt))
+
+    # ✅ OpenAI functions 에이전트: 툴 호출 → 툴 결과를 브리핑 형식으로 정리
+    def _function_call(self, messages, functions):
+        if isinstance(messages[-1], FunctionMessage):
+            return AIMessage(content=_format_results(messages[-1].content))
+        names = [f.get("name") or f.get("function", {}).get("name") for f in functions]
+        request = next((_text(m) for m in reversed(messages) if m.type == "human"), "")
+        tool = _pick_tool(request, names)
+        if tool is None:
+            return AIMessage(content=REFUSAL)
+        keyword, days = parse_request(request)
+        arguments = json.dumps({"keyword": keyword, "days": days}, ensure_ascii=False)
+        return AIMessage(content="", additional_kwargs={"function_call": {"name": tool, "arguments": arguments}})
+
+    def _complete(self, prompt):
+        # 동의어 생성
+        match = re.search(r'synonyms for the keyword "(.+?)"', prompt)
+        if match and "Review the following" not in prompt:
+            country = re.search(r"commonly used in ([\w ]+?)\.", prompt)
+            synonyms = lookup_synonyms(match.group(1), country.group(1) if country else "Korea") or []
+            return ", ".join(synonyms)
+        # 동의어 검수: 받은 리스트 그대로
+        match = re.search(r"used in [^\n]+:\s*\n\s*(.+?)\n", prompt)
+        if "Review the following list of synonyms" in prompt and match:
+            return ", ".join(_split_list(match.group(1)))
+        # 빈도순 정렬: 받은 순서 그대로
+        match = re.search(r"Synonyms:\s*(.+)", prompt)
+        if "Rank the following list of synonyms" in prompt and match:
+            return ", ".join(_split_list(match.group(1)))
+        # ReAct 에이전트
+        if "Action Input:" in prompt and "Question:" in prompt:
+            return self._react(prompt)
+        # RetrievalQA (stuff): 문맥의 앞부분으로 답변
+        match = re.search(r"answer the question at the end\.[^\n]*\n+(.+?)\n+Question:", prompt, re.DOTALL)
+        if match:
+            return match.group(1).strip()[:500]
+        return prompt.strip().splitlines()[-1][:500] if prompt.strip() else ""
+
+    def _react(self, prompt):
+        question = prompt.rsplit("Question:", 1)[-1].split("\n", 1)[0].strip()
+        observations = re.findall(r"Observation:\s*(.+?)(?:\nThought:|$)", prompt.rsplit("Question:", 1)[-1], re.DOTALL)
+        if observations:
+            return f"Thought: I now know the final answer\nFinal Answer: {observations[-1].strip()[:1000]}"
+        tools_match = re.search(r"should be one of \[(.+?)\]", prompt)
+        tool_names = _split_list(tools_match.group(1)) if tools_match else []
+        tool = _pick_tool(question, tool_names) or (tool_names[0] if tool_names else None)
+        if tool is None:
+            return f"Final Answer: {question}"
+        return f"Thought: {tool}로 확인합니다.\nAction: {tool}\nAction Input: {question}"
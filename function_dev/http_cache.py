@@ -0,0 +1,263 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from function_dev.cache_paths import CACHE_DIR
+from function_dev.http_client import fetch, HTTP_TIMEOUT
+
+# ✅ HTTP 캐시 설정
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "1") == "1"
+HTTP_CACHE_OFFLINE = os.getenv("HTTP_CACHE_OFFLINE", "0") == "1"     # 네트워크 없이 캐시만 재생
+HTTP_CACHE_TTL = float(os.getenv("HTTP_CACHE_TTL", "86400"))         # 재검증 없이 쓰는 기간(초)
+HTTP_CACHE_MAX_AGE_DAYS = float(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30"))
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "1024"))
+HTTP_CACHE_MAX_ITEM_MB = float(os.getenv("HTTP_CACHE_MAX_ITEM_MB", "50"))
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+EVICT_EVERY_N_WRITES = 50
+
+# 캐시 키에서 제외할 추적용 쿼리 파라미터 (utm_* 포함). API 키는 응답을 바꿀 수 있으므로 키에 포함 (해시로만 저장)
+IGNORED_QUERY_PARAMS = {"fbclid", "gclid"}
+SECRET_QUERY_PARAMS = {"apikey", "key", "api_key"}
+KEPT_HEADERS = ["Content-Type", "ETag", "Last-Modified"]
+
+_writes = 0
+_writes_lock = threading.Lock()
+
+
+# ✅ URL 정규화 (스킴/호스트 소문자, fragment·추적 파라미터 제거, 쿼리 정렬)
+def canonicalize_url(url):
+    parts = urlsplit(url.strip())
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in IGNORED_QUERY_PARAMS
+    )
+    path = parts.path or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ""))
+
+
+# ✅ 메타 파일에 저장할 URL (API 키 값은 가림)
+def _redact_url(url):
+    parts = urlsplit(url)
+    query = [(k, "***" if k.lower() in SECRET_QUERY_PARAMS else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def _entry_paths(url):
+    key = hashlib.sha256(canonicalize_url(url).encode("utf-8")).hexdigest()
+    directory = os.path.join(HTTP_CACHE_DIR, key[:2])
+    return directory, os.path.join(directory, key + ".body"), os.path.join(directory, key + ".json")
+
+
+def _load_meta(meta_path, body_path):
+    if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+        return None
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_meta(meta_path, meta):
+    directory = os.path.dirname(meta_path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+
+# ✅ 캐시 파일로 requests.Response를 구성 (.text / .json() / raise_for_status() 그대로 사용 가능)
+#    정리 작업이 동시에 본문을 지웠으면 None (캐시 미스로 처리)
+def _cached_response(url, meta, body_path, stream=False):
+    try:
+        os.utime(body_path)   # LRU 정리를 위해 마지막 사용 시각 갱신
+        body = open(body_path, "rb")
+    except FileNotFoundError:
+        return None
+    response = requests.Response()
+    response.status_code = meta.get("status_code", 200)
+    response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = url
+    if stream:
+        # requests의 stream=True와 같이 본문은 읽을 때 파일에서 가져옴 (사용 후 close())
+        response.raw = body
+    else:
+        with body:
+            response._content = body.read()
+    response.from_cache = True
+    response.cache_path = body_path
+    return response
+
+
+# ✅ 이미 받은 부분 + 남은 청크를 닫으면 삭제되는 임시 파일로 옮김
+def _spill_to_tempfile(written_path, chunk, chunks):
+    spool = tempfile.TemporaryFile()
+    with open(written_path, "rb") as written:
+        shutil.copyfileobj(written, spool)
+    spool.write(chunk)
+    for chunk in chunks:
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
+# ✅ 캐시하지 않은 응답 본문(임시 파일)으로 requests.Response를 구성
+def _uncached_response(url, original, body_file, stream=False):
+    response = requests.Response()
+    response.status_code = original.status_code
+    response.headers = original.headers
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = url
+    if stream:
+        response.raw = body_file   # close()하면 임시 파일도 삭제됨
+    else:
+        response._content = body_file.read()
+        body_file.close()
+    response.from_cache = False
+    response.cache_path = None
+    return response
+
+
+def cached_get(url, ttl=None, timeout=HTTP_TIMEOUT, polite=True, stream=False, **kwargs):
+    """
+    URL 응답 본문을 디스크에 캐시하는 GET.
+    ttl(초) 이내면 네트워크 없이 반환하고, 지나면 ETag/Last-Modified로 조건부 재검증합니다.
+    HTTP_CACHE_OFFLINE=1이면 캐시된 응답만 반환합니다 (오프라인 재생/벤치마크용).
+    반환 값에는 from_cache, cache_path(디스크 본문 경로) 속성이 추가됩니다.
+    stream=True이면 본문을 메모리에 올리지 않습니다 (cache_path를 직접 쓰거나 읽은 뒤 close()).
+    """
+    if not HTTP_CACHE_ENABLED:
+        response = fetch(url, timeout=timeout, polite=polite, stream=stream, **kwargs)
+        response.from_cache, response.cache_path = False, None
+        return response
+
+    ttl = HTTP_CACHE_TTL if ttl is None else ttl
+    directory, body_path, meta_path = _entry_paths(url)
+    meta = _load_meta(meta_path, body_path)
+
+    if meta is not None and (HTTP_CACHE_OFFLINE or time.time() - meta["fetched_at"] < ttl):
+        cached = _cached_response(url, meta, body_path, stream)
+        if cached is not None:
+            return cached
+        meta = None
+    if HTTP_CACHE_OFFLINE:
+        raise requests.ConnectionError(f"오프라인 모드: 캐시에 없는 URL {url}")
+
+    request_headers = kwargs.pop("headers", None)
+    headers = dict(request_headers or {})
+    if meta is not None:
+        cached_headers = CaseInsensitiveDict(meta.get("headers", {}))
+        if cached_headers.get("ETag"):
+            headers["If-None-Match"] = cached_headers["ETag"]
+        if cached_headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+
+    response = fetch(url, timeout=timeout, polite=polite, headers=headers, stream=True, **kwargs)
+
+    # ✅ 변경 없음 → 캐시 본문 재사용
+    if response.status_code == 304 and meta is not None:
+        response.close()
+        meta["fetched_at"] = time.time()
+        _save_meta(meta_path, meta)
+        cached = _cached_response(url, meta, body_path, stream)
+        if cached is not None:
+            return cached
+        # 재검증 사이에 본문이 정리됨 → 조건 없이 다시 받기
+        return cached_get(url, ttl=ttl, timeout=timeout, polite=polite, stream=stream, headers=request_headers, **kwargs)
+
+    if response.status_code != 200:
+        response.from_cache, response.cache_path = False, None
+        return response
+
+    # ✅ 본문을 메모리에 모두 올리지 않고 청크 단위로 임시 파일에 저장 후 교체
+    #    HTTP_CACHE_MAX_ITEM_MB를 넘는 응답은 캐시에 저장하지 않고 호출한 쪽에 그대로 전달
+    os.makedirs(directory, exist_ok=True)
+    max_bytes = HTTP_CACHE_MAX_ITEM_MB * 1024 * 1024
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    size = 0
+    oversized = None
+    try:
+        with os.fdopen(fd, "wb") as f:
+            chunks = response.iter_content(chunk_size=64 * 1024)
+            for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    print(f"⚠️ 응답 크기 초과 ({HTTP_CACHE_MAX_ITEM_MB}MB) → 캐시하지 않음: {url}")
+                    f.flush()
+                    oversized = _spill_to_tempfile(tmp_path, chunk, chunks)
+                    break
+                f.write(chunk)
+        if oversized is None:
+            os.replace(tmp_path, body_path)
+    finally:
+        response.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    if oversized is not None:
+        return _uncached_response(url, response, oversized, stream)
+
+    meta = {
+        "url": _redact_url(url),
+        "status_code": 200,
+        "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+        "fetched_at": time.time(),
+        "size": size
+    }
+    _save_meta(meta_path, meta)
+    cached = _cached_response(url, meta, body_path, stream)
+    _maybe_evict()
+    if cached is not None:
+        return cached
+    # 저장 직후 다른 요청의 정리 작업이 본문을 지움 → 다시 받기
+    return cached_get(url, ttl=ttl, timeout=timeout, polite=polite, stream=stream, headers=request_headers, **kwargs)
+
+
+def _maybe_evict():
+    global _writes
+    with _writes_lock:
+        _writes += 1
+        should_evict = _writes % EVICT_EVERY_N_WRITES == 0
+    if should_evict:
+        evict_http_cache()
+
+
+# ✅ 오래된 항목 삭제 + 용량 초과 시 가장 오래 안 쓴 항목부터 삭제
+def evict_http_cache(max_age_days=HTTP_CACHE_MAX_AGE_DAYS, max_mb=HTTP_CACHE_MAX_MB):
+    if not os.path.isdir(HTTP_CACHE_DIR):
+        return 0
+    entries = []
+    for root, _, files in os.walk(HTTP_CACHE_DIR):
+        for name in files:
+            if name.endswith(".body"):
+                body_path = os.path.join(root, name)
+                try:
+                    stat = os.stat(body_path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, body_path))
+
+    entries.sort()
+    now = time.time()
+    total = sum(size for _, size, _ in entries)
+    max_bytes = max_mb * 1024 * 1024
+    removed = 0
+    for last_used, size, body_path in entries:
+        if now - last_used <= max_age_days * 86400 and total <= max_bytes:
+            break
+        for path in (body_path, body_path[:-len(".body")] + ".json"):
+            if os.path.exists(path):
+                os.remove(path)
+        total -= size
+        removed += 1
+    if removed:
+        print(f"🧹 HTTP 캐시 정리: {removed}건 삭제")
+    return removed
@@ -0,0 +1,90 @@
+import os
+import time
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from function_dev.offline_replay import OFFLINE_MODE, install_offline_transport
+
+# ✅ HTTP 설정
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "32"))
+PER_HOST_DELAY = float(os.getenv("HTTP_PER_HOST_DELAY", "1.0"))   # 같은 도메인 요청 간 최소 간격(초)
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "8"))       # 공용 다운로드 풀 크기 (모든 파이프라인 공유)
+
+_session = None
+_session_lock = threading.Lock()
+_fetch_executor = None
+
+
+# ✅ 커넥션 풀 + 재시도가 설정된 공용 세션
+def get_session():
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET", "HEAD"]
+            )
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if OFFLINE_MODE:
+                install_offline_transport(session)
+            _session = session
+        return _session
+
+
+# ✅ 공용 다운로드 풀 (파이프라인이 동시에 돌아도 동시 다운로드 수는 FETCH_MAX_WORKERS로 제한)
+def get_fetch_executor():
+    global _fetch_executor
+    with _session_lock:
+        if _fetch_executor is None:
+            _fetch_executor = ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS, thread_name_prefix="fetch")
+        return _fetch_executor
+
+
+# ✅ 도메인별 요청 간격 제한 (전역 sleep 대신)
+class HostRateLimiter:
+    def __init__(self, delay):
+        self.delay = delay
+        self.next_allowed = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url):
+        if self.delay <= 0:
+            return
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_allowed.get(host, now))
+            self.next_allowed[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_rate_limiter = HostRateLimiter(PER_HOST_DELAY)
+
+
+def fetch(url, timeout=HTTP_TIMEOUT, polite=True, **kwargs):
+    """
+    공용 세션으로 GET 요청을 보냅니다. polite=True이면 같은 도메인에 PER_HOST_DELAY 간격을 둡니다.
+    """
+    if polite:
+        _rate_limiter.wait(url)
+    return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def decode_html(response):
+    # 인코딩 헤더가 없으면 requests가 ISO-8859-1로 가정하므로 본문 기준으로 추정
+    if not response.encoding or response.encoding.lower() == "iso-8859-1":
+        response.encoding = response.apparent_encoding
+    return response.text
@@ -0,0 +1,53 @@
+import os
+import torch
+from function_dev.cache_paths import CACHE_DIR
+
+# ✅ 추론 백엔드: "torch"(fp32) | "int8"(동적 양자화) | "onnx"(ONNX Runtime)
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "torch")
+ONNX_EXPORT_DIR = os.path.join(CACHE_DIR, "onnx")
+
+
+def load_seq2seq(model_name, model_cls, backend=None, device="cpu"):
+    """
+    seq2seq 모델을 선택한 백엔드로 로드합니다.
+    int8/onnx는 CPU 전용이므로 GPU가 있으면 fp32 PyTorch로 로드합니다.
+    """
+    backend = backend or INFERENCE_BACKEND
+    if backend != "torch" and device != "cpu":
+        print(f"⚠️ {backend} 백엔드는 CPU 전용 → {model_name}은 torch 백엔드로 로드")
+        backend = "torch"
+
+    if backend == "torch":
+        return model_cls.from_pretrained(model_name).to(device).eval()
+
+    if backend == "int8":
+        model = model_cls.from_pretrained(model_name).eval()
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    if backend == "onnx":
+        return _load_onnx_seq2seq(model_name)
+
+    raise ValueError(f"지원하지 않는 추론 백엔드: {backend}")
+
+
+# ✅ ONNX Runtime: 최초 1회 export 후 디스크에 저장된 encoder/decoder 세션 재사용
+def _load_onnx_seq2seq(model_name):
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError:
+        raise ImportError("INFERENCE_BACKEND=onnx 사용 시 optimum[onnxruntime] 설치가 필요합니다.")
+
+    export_dir = os.path.join(ONNX_EXPORT_DIR, model_name.replace("/", "__"))
+    if os.path.exists(os.path.join(export_dir, "config.json")):
+        return ORTModelForSeq2SeqLM.from_pretrained(export_dir, use_cache=True)
+
+    print(f"📦 ONNX export 중: {model_name} → {export_dir}")
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, use_cache=True)
+    model.save_pretrained(export_dir)
+    return model
+
+
+# ✅ 캐시 키용 모델 이름 (백엔드마다 출력이 조금씩 다를 수 있으므로 구분)
+def model_cache_name(model_name, backend=None):
+    backend = backend or INFERENCE_BACKEND
+    return model_name if backend == "torch" else f"{model_name}@{backend}"
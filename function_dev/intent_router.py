@@ -0,0 +1,135 @@
+import os
+import re
+import threading
+
+# ✅ 규칙 기반 라우터 설정 (확실한 요청은 에이전트 LLM을 거치지 않고 파이프라인을 바로 실행)
+FAST_ROUTER_ENABLED = os.getenv("FAST_ROUTER_ENABLED", "1") == "1"
+MAX_DAYS = int(os.getenv("FAST_ROUTER_MAX_DAYS", "30"))
+
+# 소스별 요청 키워드 (briefing이 가장 우선)
+SOURCE_KEYWORDS = {
+    "briefing": ["브리핑", "종합", "briefing"],
+    "news": ["뉴스", "기사", "보도", "속보", "news"],
+    "blog": ["블로그", "blog"],
+    "paper": ["논문", "학술", "paper", "research"],
+}
+
+# 날짜 표현 ("10월 3일", "2024-10-03", "10/3", "2024년") → 기간으로 볼 수 없으므로 에이전트에게 넘김
+ABSOLUTE_DATE_PATTERN = r"\d+\s*월\s*\d+\s*일|\d{4}\s*년|\d{4}[-./]\d{1,2}[-./]\d{1,2}|\b\d{1,2}/\d{1,2}\b"
+
+# 기간 표현 → 일수
+DAY_PATTERNS = [
+    (r"(?<![월\d])(?<!월 )(\d+)\s*(?:일|days?)", lambda m: int(m.group(1))),
+    (r"(\d+)\s*(?:주|weeks?)", lambda m: int(m.group(1)) * 7),
+    (r"(\d+)\s*(?:개월|달|months?)", lambda m: int(m.group(1)) * 30),
+    (r"오늘|today", lambda m: 1),
+    (r"어제|yesterday", lambda m: 2),
+    (r"이번\s*주|일주일|한\s*주|this week|last week", lambda m: 7),
+    (r"한\s*달|이번\s*달|this month|last month", lambda m: 30),
+]
+
+# 키워드 표현: "'생성형 AI'" (따옴표), "생성형 AI 관련" / "LLM에 대한" (앞쪽 명사구), "about generative AI" (뒤쪽 명사구)
+QUOTED_KEYWORD_PATTERN = r"[\"'“‘]([^\"'”’]+)[\"'”’]"
+KEYWORD_BEFORE_PATTERN = r"\s*(?:관련|에\s*대한|에\s*관한|에\s*대해)"
+KEYWORD_AFTER_PATTERN = r"\b(?:about|on|regarding)\s+"
+# 명사구에 포함하지 않는 기간·수식 표현 (여기서 명사구가 끝남)
+PHRASE_STOPWORDS = {
+    "최근", "오늘", "어제", "지난", "이번", "요즘", "최신", "동안", "주", "달", "간", "중", "중에서", "가운데",
+    "this", "last", "past", "today", "yesterday", "from", "in", "for", "over", "within", "the", "of", "and", "please",
+}
+PHRASE_TIME_TOKEN = r"\d+\s*(?:일|주|개월|달|days?|weeks?|months?)\w*"
+MAX_PHRASE_WORDS = 4
+
+_stats = {"fast": 0, "agent": 0}
+_stats_lock = threading.Lock()
+
+
+def detect_sources(prompt):
+    lowered = prompt.lower()
+    return [source for source, words in SOURCE_KEYWORDS.items() if any(word in lowered for word in words)]
+
+
+def parse_days(prompt):
+    lowered = prompt.lower()
+    for pattern, to_days in DAY_PATTERNS:
+        match = re.search(pattern, lowered)
+        if match:
+            return to_days(match)
+    return None
+
+
+def _is_phrase_boundary(token):
+    lowered = token.lower()
+    return (
+        lowered in PHRASE_STOPWORDS or re.fullmatch(PHRASE_TIME_TOKEN, lowered) is not None or
+        any(lowered.startswith(word) for words in SOURCE_KEYWORDS.values() for word in words)
+    )
+
+
+# ✅ 표현 바로 앞/뒤의 단어를 기간·소스 단어가 나올 때까지 모아 명사구로 사용 ("최근 3일간 생성형 AI 관련" → "생성형 AI")
+def _collect_phrase(tokens):
+    phrase = []
+    for token in tokens:
+        token = token.strip(",.?!")
+        if not token or _is_phrase_boundary(token) or len(phrase) >= MAX_PHRASE_WORDS:
+            break
+        phrase.append(token)
+    return phrase
+
+
+def parse_keyword(prompt):
+    match = re.search(QUOTED_KEYWORD_PATTERN, prompt)
+    if match and match.group(1).strip():
+        return match.group(1).strip()
+
+    match = re.search(KEYWORD_BEFORE_PATTERN, prompt)
+    if match:
+        phrase = _collect_phrase(reversed(prompt[:match.start()].split()))
+        if phrase:
+            return " ".join(reversed(phrase))
+
+    match = re.search(KEYWORD_AFTER_PATTERN, prompt, re.IGNORECASE)
+    if match:
+        phrase = _collect_phrase(prompt[match.end():].split())
+        if phrase:
+            return " ".join(phrase)
+    return None
+
+
+# ✅ "최근 2일간 AI 관련 뉴스 정리해줘" → ("news", "AI", 2)
+def route_request(prompt):
+    """
+    소스, 키워드, 기간을 규칙으로 뽑아 (source, keyword, days)를 돌려줍니다.
+    소스가 하나로 정해지지 않거나(브리핑 제외) 키워드를 찾지 못하거나 특정 날짜가 있으면 None을 돌려 에이전트가 처리하게 합니다.
+    기간 표현이 없으면 1일로 봅니다.
+    """
+    if not FAST_ROUTER_ENABLED or re.search(ABSOLUTE_DATE_PATTERN, prompt):
+        return None
+    sources = detect_sources(prompt)
+    if "briefing" in sources:
+        source = "briefing"
+    elif len(sources) == 1:
+        source = sources[0]
+    else:
+        return None
+    keyword = parse_keyword(prompt)
+    if not keyword:
+        return None
+    days = parse_days(prompt) or 1
+    if not 1 <= days <= MAX_DAYS:
+        return None
+    return source, keyword, days
+
+
+# ✅ 빠른 경로 적중률 기록
+def record_route(fast):
+    with _stats_lock:
+        _stats["fast" if fast else "agent"] += 1
+        total = _stats["fast"] + _stats["agent"]
+        print(f"🧭 빠른 경로 적중률: {_stats['fast']}/{total} ({_stats['fast'] / total:.0%})")
+
+
+def router_stats():
+    with _stats_lock:
+        total = _stats["fast"] + _stats["agent"]
+        return dict(_stats, total=total, hit_rate=_stats["fast"] / total if total else 0.0)
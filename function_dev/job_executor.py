@@ -0,0 +1,96 @@
+import os
+import time
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# ✅ 웹 요청 실행 설정
+JOB_MAX_WORKERS = int(os.getenv("JOB_MAX_WORKERS", "2"))   # 동시에 실행하는 브리핑 요청 수
+JOB_MAX_QUEUE = int(os.getenv("JOB_MAX_QUEUE", "8"))       # 실행을 기다릴 수 있는 요청 수 (넘으면 접수 거절)
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class Job:
+    def __init__(self, executor):
+        self._executor = executor
+        self.future = None
+        self.submitted_at = time.time()
+        self.started_at = None
+
+    def position(self):
+        """대기 순번 (1부터). 실행 중이거나 끝났으면 0"""
+        return self._executor.position(self)
+
+    def wait(self, timeout=None):
+        """timeout초 안에 끝나면 True"""
+        done, _ = wait([self.future], timeout=timeout)
+        return bool(done)
+
+    def done(self):
+        return self.future.done()
+
+    def result(self):
+        return self.future.result()
+
+
+class JobExecutor:
+    """
+    동시 실행 수가 정해진 작업 실행기입니다.
+    실행 중 max_workers개 + 대기 max_queue개를 넘는 요청은 JobQueueFull로 바로 거절하고,
+    대기 중인 작업은 position()으로 순번을 알려줍니다. 작업은 제출한 쪽의 contextvars를 그대로 이어받습니다.
+    """
+
+    def __init__(self, max_workers=JOB_MAX_WORKERS, max_queue=JOB_MAX_QUEUE):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="briefing-job")
+        self._lock = threading.Lock()
+        self._waiting = []
+        self._running = 0
+
+    def submit(self, fn, *args, **kwargs):
+        job = Job(self)
+        context = contextvars.copy_context()
+
+        def run():
+            with self._lock:
+                self._waiting.remove(job)
+                self._running += 1
+            job.started_at = time.time()
+            try:
+                return context.run(fn, *args, **kwargs)
+            finally:
+                with self._lock:
+                    self._running -= 1
+
+        with self._lock:
+            if len(self._waiting) >= self.max_queue:
+                raise JobQueueFull(f"대기 중인 요청이 {len(self._waiting)}개입니다.")
+            self._waiting.append(job)
+            job.future = self._pool.submit(run)
+        return job
+
+    def position(self, job):
+        with self._lock:
+            return self._waiting.index(job) + 1 if job in self._waiting else 0
+
+    @property
+    def stats(self):
+        with self._lock:
+            return {"running": self._running, "waiting": len(self._waiting)}
+
+
+_job_executor = None
+_job_executor_lock = threading.Lock()
+
+
+# ✅ 프로세스 전체에서 공유하는 작업 실행기
+def get_job_executor():
+    global _job_executor
+    with _job_executor_lock:
+        if _job_executor is None:
+            _job_executor = JobExecutor()
+        return _job_executor
@@ -0,0 +1,23 @@
+from function_dev.offline_replay import OFFLINE_MODE
+
+
+# ✅ 챗 모델 생성 (OFFLINE_MODE=1이면 결정적인 가짜 모델)
+def get_chat_model(online_cls, **kwargs):
+    """
+    online_cls(**kwargs)로 챗 모델을 만들고, 오프라인 모드에서는 같은 자리에 FakeChatModel을 돌려줍니다.
+    """
+    if OFFLINE_MODE:
+        from function_dev.fake_llm import FakeChatModel
+        return FakeChatModel(temperature=kwargs.get("temperature", 0.0))
+    return online_cls(**kwargs)
+
+
+# ✅ OpenAI SDK를 직접 쓰는 호출용 (messages: [{"role": ..., "content": ...}])
+def complete_chat(client, messages, model="gpt-3.5-turbo", temperature=0.0):
+    if OFFLINE_MODE:
+        from function_dev.fake_llm import FakeChatModel
+        return FakeChatModel(temperature=temperature).invoke(
+            [(m["role"].replace("user", "human"), m["content"]) for m in messages]
+        ).content
+    response = client.chat.completions.create(model=model, messages=messages, temperature=temperature)
+    return response.choices[0].message.content
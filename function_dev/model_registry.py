@@ -0,0 +1,158 @@
+import os
+import gc
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import torch
+from function_dev.inference_backend import load_seq2seq
+
+# ✅ 디바이스 설정
+device = "cuda" if torch.cuda.is_available() else "cpu"
+
+# ✅ 메모리 예산 (MB, 0이면 무제한) / 유휴 모델 해제 기준 (초)
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("MODEL_MEMORY_BUDGET_MB", "0"))
+MODEL_IDLE_SECONDS = int(os.getenv("MODEL_IDLE_SECONDS", "1800"))
+
+# ✅ 생성 작업 실행기: 여러 파이프라인이 동시에 돌아도 seq2seq 생성은 이 풀에서 순서대로 실행
+MODEL_EXECUTOR_WORKERS = int(os.getenv("MODEL_EXECUTOR_WORKERS", "1"))
+MODEL_THREAD_PREFIX = "model-executor"
+
+_loaders = {}
+_models = {}    # name -> {"model": ..., "size_mb": ..., "last_used": ...}
+_lock = threading.RLock()
+_model_executor = None
+
+
+def register_model(name, loader):
+    _loaders[name] = loader
+
+
+def get_model(name):
+    """
+    등록된 모델을 처음 사용할 때 로드하고, 이후에는 프로세스 전체에서 같은 인스턴스를 공유합니다.
+    """
+    with _lock:
+        entry = _models.get(name)
+        if entry is None:
+            if name not in _loaders:
+                raise KeyError(f"등록되지 않은 모델: {name}")
+            print(f"📦 모델 로드 중: {name}")
+            start = time.time()
+            model = _loaders[name]()
+            size_mb = _estimate_size_mb(model)
+            entry = {"model": model, "size_mb": size_mb, "last_used": time.time()}
+            _models[name] = entry
+            print(f"✅ 모델 로드 완료: {name} ({size_mb:.0f}MB, {time.time() - start:.1f}초)")
+            _enforce_budget(keep=name)
+        entry["last_used"] = time.time()
+        return entry["model"]
+
+
+def unload_model(name):
+    with _lock:
+        entry = _models.pop(name, None)
+    if entry is None:
+        return False
+    del entry
+    gc.collect()
+    if torch.cuda.is_available():
+        torch.cuda.empty_cache()
+    print(f"🧹 모델 해제: {name}")
+    return True
+
+
+def unload_idle_models(max_idle_seconds=MODEL_IDLE_SECONDS):
+    now = time.time()
+    with _lock:
+        idle = [name for name, entry in _models.items() if now - entry["last_used"] > max_idle_seconds]
+    for name in idle:
+        unload_model(name)
+    return idle
+
+
+def loaded_models():
+    with _lock:
+        return {name: round(entry["size_mb"], 1) for name, entry in _models.items()}
+
+
+def run_model(fn, *args, **kwargs):
+    """
+    fn(*args, **kwargs)를 공용 모델 실행기에서 torch.no_grad()로 실행하고 결과를 기다립니다.
+    이미 실행기 스레드 안이면 바로 실행합니다.
+    """
+    global _model_executor
+
+    def call():
+        with torch.no_grad():
+            return fn(*args, **kwargs)
+
+    if threading.current_thread().name.startswith(MODEL_THREAD_PREFIX):
+        return call()
+    with _lock:
+        if _model_executor is None:
+            _model_executor = ThreadPoolExecutor(max_workers=MODEL_EXECUTOR_WORKERS, thread_name_prefix=MODEL_THREAD_PREFIX)
+    return _model_executor.submit(call).result()
+
+
+# ✅ 메모리 예산 초과 시 가장 오래 안 쓴 모델부터 해제
+def _enforce_budget(keep):
+    if MODEL_MEMORY_BUDGET_MB <= 0:
+        return
+    # 해제할 모델은 잠금 안에서 한 번에 고름 (동시에 unload_idle_models가 돌아도 목록이 어긋나지 않도록)
+    with _lock:
+        total = sum(entry["size_mb"] for entry in _models.values())
+        evict = []
+        for name, entry in sorted(
+            ((name, entry) for name, entry in _models.items() if name != keep),
+            key=lambda item: item[1]["last_used"]
+        ):
+            if total <= MODEL_MEMORY_BUDGET_MB:
+                break
+            total -= entry["size_mb"]
+            evict.append(name)
+    for name in evict:
+        unload_model(name)
+
+
+def _estimate_size_mb(obj):
+    modules = obj if isinstance(obj, (tuple, list)) else [obj]
+    total_bytes = 0
+    for module in modules:
+        if isinstance(module, torch.nn.Module):
+            total_bytes += sum(p.numel() * p.element_size() for p in module.parameters())
+            total_bytes += sum(b.numel() * b.element_size() for b in module.buffers())
+    return total_bytes / (1024 * 1024)
+
+
+# ✅ 모델 로더 (import 시점이 아니라 첫 사용 시점에 실행)
+def _load_kobart():
+    from transformers import BartForConditionalGeneration, PreTrainedTokenizerFast
+    model = load_seq2seq('digit82/kobart-summarization', BartForConditionalGeneration, device=device)
+    tokenizer = PreTrainedTokenizerFast.from_pretrained('digit82/kobart-summarization')
+    return model, tokenizer
+
+
+def _load_bart_cnn():
+    from transformers import BartTokenizer, BartForConditionalGeneration
+    model = load_seq2seq("facebook/bart-large-cnn", BartForConditionalGeneration)
+    tokenizer = BartTokenizer.from_pretrained("facebook/bart-large-cnn")
+    return model, tokenizer
+
+
+def _load_translator():
+    from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
+    translation_model_name = "seongs/ke-t5-base-aihub-koen-translation-integrated-10m-en-to-ko"
+    model = load_seq2seq(translation_model_name, AutoModelForSeq2SeqLM)
+    tokenizer = AutoTokenizer.from_pretrained(translation_model_name)
+    return model, tokenizer
+
+
+def _load_embedder():
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer("sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+
+
+register_model("kobart", _load_kobart)
+register_model("bart_cnn", _load_bart_cnn)
+register_model("translator", _load_translator)
+register_model("embedder", _load_embedder)
@@ -0,0 +1,128 @@
+import re
+import hashlib
+from collections import defaultdict
+import numpy as np
+
+# ✅ MinHash / LSH 설정
+NEAR_DUP_THRESHOLD = 0.8     # 추정 Jaccard 유사도 기준
+SHINGLE_SIZE = 5             # 문자 n-gram (한국어는 띄어쓰기가 달라도 잡히도록 문자 단위)
+NUM_PERM = 64
+LSH_BANDS = 16               # 16 bands × 4 rows
+_MERSENNE_PRIME = (1 << 31) - 1   # 32비트 해시 × 31비트 계수가 uint64 안에서 넘치지 않도록
+
+_rng = np.random.RandomState(42)
+_PERM_A = _rng.randint(1, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, _MERSENNE_PRIME, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text, k=SHINGLE_SIZE):
+    normalized = re.sub(r"\s+", " ", (text or "").lower()).strip()
+    if len(normalized) <= k:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + k] for i in range(len(normalized) - k + 1)}
+
+
+def minhash_signature(shingle_set):
+    if not shingle_set:
+        return None
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "big") for s in shingle_set),
+        dtype=np.uint64, count=len(shingle_set)
+    )
+    # (a·h + b) mod p 를 순열마다 계산해 최솟값 → (NUM_PERM,) 시그니처
+    return ((np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME).min(axis=1)
+
+
+def estimated_similarity(sig_a, sig_b):
+    return float(np.mean(sig_a == sig_b))
+
+
+def _band_keys(signature):
+    rows = NUM_PERM // LSH_BANDS
+    return [(band, tuple(signature[band * rows:(band + 1) * rows])) for band in range(LSH_BANDS)]
+
+
+def find_near_duplicate_clusters(texts, threshold=NEAR_DUP_THRESHOLD):
+    """
+    LSH 버킷으로 후보 쌍만 골라 MinHash 유사도를 확인하고, threshold 이상인 문서끼리 묶은 클러스터(인덱스 리스트)를 반환합니다.
+    """
+    signatures = [minhash_signature(shingles(text)) for text in texts]
+
+    parent = list(range(len(texts)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = defaultdict(list)
+    for idx, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        for key in _band_keys(signature):
+            buckets[key].append(idx)
+
+    checked = set()
+    for members in buckets.values():
+        for i in range(len(members)):
+            for j in range(i + 1, len(members)):
+                pair = (members[i], members[j])
+                if pair in checked:
+                    continue
+                checked.add(pair)
+                if estimated_similarity(signatures[pair[0]], signatures[pair[1]]) >= threshold:
+                    parent[find(pair[1])] = find(pair[0])
+
+    clusters = defaultdict(list)
+    for idx in range(len(texts)):
+        clusters[find(idx)].append(idx)
+    return sorted(clusters.values(), key=lambda cluster: cluster[0])
+
+
+# ✅ 클러스터마다 본문이 가장 긴 항목 하나만 남김 (원래 순서 유지)
+def dedupe_near_duplicates(items, text_key="full_text", title_key="title", threshold=NEAR_DUP_THRESHOLD):
+    if len(items) < 2:
+        return list(items)
+    clusters = find_near_duplicate_clusters([item.get(text_key, "") for item in items], threshold)
+
+    keep = set()
+    for cluster in clusters:
+        representative = max(cluster, key=lambda idx: len(items[idx].get(text_key, "")))
+        keep.add(representative)
+        for idx in cluster:
+            if idx != representative:
+                print(f"🪞 유사 중복 제외: {items[idx].get(title_key, '')} ≈ {items[representative].get(title_key, '')}")
+
+    removed = len(items) - len(keep)
+    if removed:
+        print(f"🧹 유사 중복 제거: {len(items)}개 중 {removed}개 제외")
+    return [item for idx, item in enumerate(items) if idx in keep]
+
+
+# ✅ 스트리밍용 증분 인덱스: 먼저 들어온 문서를 대표로 두고 이후 유사 중복은 거절
+class NearDuplicateIndex:
+    def __init__(self, threshold=NEAR_DUP_THRESHOLD):
+        self.threshold = threshold
+        self.buckets = defaultdict(list)
+        self.signatures = []
+        self.titles = []
+
+    def add(self, text, title=""):
+        """
+        이미 추가된 문서와 유사 중복이 아니면 인덱스에 추가하고 True, 중복이면 False를 반환합니다.
+        """
+        signature = minhash_signature(shingles(text))
+        if signature is None:
+            return True
+        keys = _band_keys(signature)
+        candidates = {idx for key in keys for idx in self.buckets.get(key, [])}
+        for idx in sorted(candidates):
+            if estimated_similarity(signature, self.signatures[idx]) >= self.threshold:
+                print(f"🪞 유사 중복 제외: {title} ≈ {self.titles[idx]}")
+                return False
+        for key in keys:
+            self.buckets[key].append(len(self.signatures))
+        self.signatures.append(signature)
+        self.titles.append(title)
+        return True
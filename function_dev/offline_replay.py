@@ -0,0 +1,215 @@
+import os
+import re
+import json
+import time
+import random
+import threading
+from html import escape
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape as xml_escape
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# ✅ 오프라인 재생 설정 (NewsAPI / Google CSE / arXiv / SerpAPI / 기사·블로그 본문을 샘플 데이터로 대체)
+OFFLINE_MODE = os.getenv("OFFLINE_MODE", "0") == "1"
+OFFLINE_LATENCY_MS = float(os.getenv("OFFLINE_LATENCY_MS", "0"))      # 요청마다 더할 지연
+OFFLINE_JITTER_MS = float(os.getenv("OFFLINE_JITTER_MS", "0"))        # 지연에 더할 무작위 편차 (0 ~ 값)
+OFFLINE_ERROR_RATE = float(os.getenv("OFFLINE_ERROR_RATE", "0"))      # 503으로 실패시킬 요청 비율
+OFFLINE_SEED = int(os.getenv("OFFLINE_SEED", "42"))
+
+if OFFLINE_MODE:
+    # 허깅페이스 모델도 로컬 캐시만 사용 (transformers import 전에 설정되어야 함)
+    os.environ.setdefault("HF_HUB_OFFLINE", "1")
+    os.environ.setdefault("TRANSFORMERS_OFFLINE", "1")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_NEWS_PATH = os.path.join(BASE_DIR, "sample_news", "news_data_full.json")
+SAMPLE_BLOGS_PATH = os.path.join(BASE_DIR, "sample_blogs", "blogs_data.json")
+SAMPLE_PAPERS_PATH = os.path.join(BASE_DIR, "sample_papers", "arxiv_papers.json")
+SAMPLE_PDF_PATH = os.path.join(BASE_DIR, "sample_papers", "LLM_GPU_Paper.pdf")
+
+CSE_PAGE_SIZE = 10
+SNIPPET_CHARS = 150
+ABSTRACT_CHARS = 1500
+
+
+def _load_json(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _split_or_query(query):
+    return [term.strip().strip('"').lower() for term in re.split(r"\s+OR\s+", query or "") if term.strip()]
+
+
+def _matches(terms, *texts):
+    haystack = " ".join(text or "" for text in texts).lower()
+    return any(term in haystack for term in terms)
+
+
+def _html_page(title, text, container='<div class="entry-content">{}</div>'):
+    paragraphs = "".join(f"<p>{escape(p.strip())}</p>" for p in text.split("\n") if p.strip())
+    return (
+        f"<html><head><meta charset=\"utf-8\"><title>{escape(title or '')}</title></head>"
+        f"<body><h1>{escape(title or '')}</h1>{container.format(paragraphs)}</body></html>"
+    )
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    requests 세션에 마운트하는 전송 어댑터로, 외부 API와 본문 페이지 요청을 샘플 데이터로 응답합니다.
+    latency_ms / jitter_ms 만큼 지연하고, error_rate 비율로 503을 돌려줍니다. (seed 고정으로 재현 가능)
+    """
+
+    def __init__(self, latency_ms=OFFLINE_LATENCY_MS, jitter_ms=OFFLINE_JITTER_MS, error_rate=OFFLINE_ERROR_RATE,
+                 seed=OFFLINE_SEED):
+        super().__init__()
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.stats = {"requests": 0, "errors": 0, "not_found": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self.news = _load_json(SAMPLE_NEWS_PATH)
+        self.blogs = _load_json(SAMPLE_BLOGS_PATH)
+        self.papers = _load_json(SAMPLE_PAPERS_PATH)
+        self.pages = {}
+        for article in self.news:
+            self.pages[article["url"]] = ("text/html; charset=utf-8", _html_page(
+                article["title"], article.get("full_text", ""), "<article>{}</article>"
+            ).encode("utf-8"))
+        for blog in self.blogs:
+            self.pages[blog["url"]] = ("text/html; charset=utf-8", _html_page(blog["title"], blog["content"]).encode("utf-8"))
+
+        self.routes = [
+            ("newsapi.org", "/v2/everything", self._newsapi),
+            ("www.googleapis.com", "/customsearch/v1", self._google_cse),
+            ("export.arxiv.org", "/api/query", self._arxiv_feed),
+            ("arxiv.org", "/pdf/", self._arxiv_pdf),
+            ("serpapi.com", "/search", self._serpapi),
+        ]
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        with self._lock:
+            self.stats["requests"] += 1
+            delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0)
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay / 1000)
+        if failed:
+            with self._lock:
+                self.stats["errors"] += 1
+            return self._response(request, 503, b'{"status": "error", "message": "injected failure"}',
+                                  "application/json")
+
+        parts = urlsplit(request.url)
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        for host, path_prefix, handler in self.routes:
+            if parts.netloc.lower() == host and parts.path.startswith(path_prefix):
+                status, body, content_type = handler(parts.path, params)
+                return self._response(request, status, body, content_type)
+
+        page_url = request.url.split("#")[0]
+        if page_url in self.pages:
+            content_type, body = self.pages[page_url]
+            return self._response(request, 200, body, content_type)
+
+        with self._lock:
+            self.stats["not_found"] += 1
+        return self._response(request, 404, b"not found", "text/plain")
+
+    def close(self):
+        pass
+
+    def _response(self, request, status, body, content_type):
+        response = requests.Response()
+        response.status_code = status
+        response.reason = requests.status_codes._codes.get(status, [""])[0].upper()
+        response.headers = CaseInsensitiveDict({"Content-Type": content_type, "Content-Length": str(len(body))})
+        response._content = body
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        if "charset=" in content_type:
+            response.encoding = content_type.split("charset=")[-1]
+        return response
+
+    # ✅ NewsAPI: OR 쿼리의 단어가 제목/본문에 포함된 샘플 기사 (없으면 전체)
+    def _newsapi(self, path, params):
+        terms = _split_or_query(params.get("q"))
+        matched = [a for a in self.news if _matches(terms, a["title"], a.get("full_text"))] or self.news
+        page_size = int(params.get("pageSize", 100))
+        articles = [{
+            "source": {"id": None, "name": a.get("source")},
+            "title": a["title"],
+            "description": re.sub(r"\s+", " ", a.get("full_text", ""))[:SNIPPET_CHARS],
+            "url": a["url"],
+            "publishedAt": a.get("publishedAt")
+        } for a in matched[:page_size]]
+        body = {"status": "ok", "totalResults": len(matched), "articles": articles}
+        return 200, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+
+    # ✅ Google CSE: 샘플 블로그를 start 기준 10개씩 페이지로
+    def _google_cse(self, path, params):
+        start = int(params.get("start", 1)) - 1
+        items = [{
+            "title": blog["title"],
+            "link": blog["url"],
+            "snippet": re.sub(r"\s+", " ", blog["content"])[:SNIPPET_CHARS]
+        } for blog in self.blogs[start:start + CSE_PAGE_SIZE]]
+        body = {"items": items} if items else {}
+        return 200, json.dumps(body, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8"
+
+    # ✅ arXiv: 샘플 논문을 방금 올라온 것처럼 Atom 피드로
+    def _arxiv_feed(self, path, params):
+        published = (datetime.utcnow() - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        entries = []
+        for paper in self.papers:
+            arxiv_id = paper["url"].rsplit("/", 1)[-1].replace(".pdf", "")
+            entries.append(
+                "<entry>"
+                f"<id>http://arxiv.org/abs/{arxiv_id}</id>"
+                f"<published>{published}</published><updated>{published}</updated>"
+                f"<title>{xml_escape(paper['title'])}</title>"
+                f"<summary>{xml_escape(paper['body'][:ABSTRACT_CHARS])}</summary>"
+                "</entry>"
+            )
+        feed = '<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">' + "".join(entries) + "</feed>"
+        return 200, feed.encode("utf-8"), "application/atom+xml; charset=utf-8"
+
+    def _arxiv_pdf(self, path, params):
+        with open(SAMPLE_PDF_PATH, "rb") as f:
+            return 200, f.read(), "application/pdf"
+
+    # ✅ SerpAPI: 샘플 뉴스 중 질의어가 포함된 기사
+    def _serpapi(self, path, params):
+        terms = [t.lower() for t in (params.get("q") or "").split() if t]
+        matched = [a for a in self.news if _matches(terms, a["title"], a.get("full_text"))] or self.news
+        results = [{
+            "title": a["title"],
+            "link": a["url"],
+            "snippet": re.sub(r"\s+", " ", a.get("full_text", ""))[:SNIPPET_CHARS]
+        } for a in matched[:int(params.get("num", 10))]]
+        return 200, json.dumps({"organic_results": results}, ensure_ascii=False).encode("utf-8"), "application/json"
+
+
+_adapter = None
+
+
+def get_replay_adapter():
+    global _adapter
+    if _adapter is None:
+        _adapter = ReplayAdapter()
+    return _adapter
+
+
+# ✅ 세션의 모든 요청을 재생 어댑터로 보냄
+def install_offline_transport(session):
+    adapter = get_replay_adapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    print("🔌 오프라인 모드: 외부 요청을 샘플 데이터로 재생합니다.")
+    return adapter
@@ -1,78 +1,148 @@
 import json
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, BartTokenizer, BartForConditionalGeneration
-from sentence_transformers import SentenceTransformer, util
+import time
+from sentence_transformers import util
+from function_dev.model_registry import get_model, run_model
+from function_dev.inference_backend import model_cache_name
+from function_dev.text_chunker import split_text_into_sentences, group_sentences_by_token_limit
+from function_dev.summary_cache import make_cache_key, get_cached_summary, put_cached_summary
 
-# 블로그 번역 모델
-translation_model_name = "seongs/ke-t5-base-aihub-koen-translation-integrated-10m-en-to-ko"
-translation_tokenizer = AutoTokenizer.from_pretrained(translation_model_name)
-translation_model = AutoModelForSeq2SeqLM.from_pretrained(translation_model_name)
+BART_MODEL_NAME = "facebook/bart-large-cnn"
+BART_GENERATION_KWARGS = dict(max_length=1024, num_beams=4, early_stopping=True)
+BART_MAX_INPUT_TOKENS = 1024   # bart-large-cnn 위치 임베딩 수 (넘으면 IndexError)
+BART_CHUNK_GENERATION_KWARGS = dict(BART_GENERATION_KWARGS, max_length=256)   # 긴 본문의 청크별 중간 요약
+TRANSLATION_MODEL_NAME = "seongs/ke-t5-base-aihub-koen-translation-integrated-10m-en-to-ko"
+
+# ✅ 번역 배치 설정: 입력 길이 기준 출력 길이 상한 (입력 토큰 × 2 + 16, 최대 256)
+TRANSLATION_BATCH_SIZE = 16
+TRANSLATION_MAX_INPUT_LENGTH = 512
+TRANSLATION_MAX_OUTPUT_LENGTH = 256
+
+# ✅ 생성 시간 통계 (사전 필터의 절약 시간 추정용)
+BART_STATS = {"papers": 0, "seconds": 0.0}
+DEFAULT_SECONDS_PER_PAPER = 30.0
+
+def estimate_bart_seconds(text=None):
+    if BART_STATS["papers"]:
+        return BART_STATS["seconds"] / BART_STATS["papers"]
+    return DEFAULT_SECONDS_PER_PAPER
+
+# ✅ 번역(ke-t5) / 임베딩 / BART 요약 모델은 model_registry에서 첫 사용 시 로드
+
+def _translation_cache_key(sentence):
+    return make_cache_key(sentence, model_cache_name(TRANSLATION_MODEL_NAME), {"unit": "sentence"})
+
+# ✅ 문장 배치 번역 (문장 단위 캐시 + 길이순 패딩 배치)
+def translate_sentences_batch(sentences, batch_size=TRANSLATION_BATCH_SIZE):
+    translations = {}
+    pending = []
+    for sentence in dict.fromkeys(sentences):
+        cached = get_cached_summary(_translation_cache_key(sentence))
+        if cached is not None:
+            translations[sentence] = cached["summary"]
+        else:
+            pending.append(sentence)
+
+    print(f"🌐 번역: 문장 {len(sentences)}개 (캐시 적중 {len(translations)}개, 번역 {len(pending)}개)")
+    if pending:
+        translation_model, translation_tokenizer = get_model("translator")
+        pending.sort(key=len)
+        for i in range(0, len(pending), batch_size):
+            batch = pending[i:i + batch_size]
+            inputs = translation_tokenizer(
+                batch, return_tensors="pt", padding=True, truncation=True, max_length=TRANSLATION_MAX_INPUT_LENGTH
+            )
+            max_new_tokens = min(TRANSLATION_MAX_OUTPUT_LENGTH, inputs["input_ids"].shape[1] * 2 + 16)
+            outputs = run_model(translation_model.generate, **inputs, max_new_tokens=max_new_tokens)
+            for sentence, translated in zip(batch, translation_tokenizer.batch_decode(outputs, skip_special_tokens=True)):
+                translations[sentence] = translated
+                put_cached_summary(_translation_cache_key(sentence), model_cache_name(TRANSLATION_MODEL_NAME), translated)
+
+    return [translations[sentence] for sentence in sentences]
 
 # 블로그 번역 함수
 def translate_summaries(text):
-    print(text)
-    inputs = translation_tokenizer([text], return_tensors="pt", padding=True, truncation=True)
-    outputs = translation_model.generate(**inputs, max_length=2048)
-    translated_text = translation_tokenizer.decode(outputs[0], skip_special_tokens=True)
-    return translated_text
-
-# ✅ 임베딩 모델 로드
-embedder = SentenceTransformer("sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+    return translate_sentences_batch([text])[0]
 
 # ✅ 유사도 필터 함수
 def is_relevant(summary: str, keyword: str, threshold=0.1) -> bool:
+    embedder = get_model("embedder")
     embeddings = embedder.encode([summary, keyword])
     similarity = util.cos_sim(embeddings[0], embeddings[1]).item()
     print(f"    🔍 유사도 점수: {similarity:.4f} (키워드: {keyword})")
     return similarity >= threshold
 
-# BART 요약 모델
-tokenizer = BartTokenizer.from_pretrained("facebook/bart-large-cnn")
-model = BartForConditionalGeneration.from_pretrained("facebook/bart-large-cnn")
-
-# ✅ 문장 단위 분할
-def split_text_into_sentences(text):
-    import re
-    return re.split(r'(?<=[.!?])\s+', text)
-
-# ✅ 문장 토큰 기준 그룹화
-def group_sentences_by_token_limit(sentences, tokenizer, max_tokens):
-    groups = []
-    current_group = ""
-    for sentence in sentences:
-        tentative_group = current_group + " " + sentence if current_group else sentence
-        tokenized = tokenizer.encode(tentative_group, return_tensors="pt")
-        if tokenized.size(1) <= max_tokens:
-            current_group = tentative_group
-        else:
-            if current_group:
-                groups.append(current_group.strip())
-            current_group = sentence
-    if current_group:
-        groups.append(current_group.strip())
-    return groups
+def _bart_generate(text, generation_kwargs):
+    model, tokenizer = get_model("bart_cnn")
+    inputs = tokenizer([text], return_tensors="pt", max_length=BART_MAX_INPUT_TOKENS, truncation=True)
 
-# 요약 함수
-def summarize_bart(text, keyword):
-    inputs = tokenizer([text], return_tensors="pt", max_length=2048, truncation=True)
-    summary_ids = model.generate(inputs["input_ids"], max_length=1024, num_beams=4, early_stopping=True)
-    final_summary = tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-
-    if keyword and is_relevant:
-        if is_relevant(final_summary, keyword):
-            final_summary = final_summary.replace('\n', ' ')
-        else:
+    def generate():
+        # 실행기 대기 시간은 제외하고 생성 시간만 기록
+        start = time.time()
+        summary_ids = model.generate(inputs["input_ids"], **generation_kwargs)
+        BART_STATS["seconds"] += time.time() - start
+        return summary_ids
+
+    summary_ids = run_model(generate)
+    return tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+
+# ✅ 영문 요약 (BART). 입력 한도를 넘는 본문(전체 PDF)은 청크별로 요약한 뒤 다시 요약
+def summarize_bart_english(text):
+    cache_key = make_cache_key(
+        text, model_cache_name(BART_MODEL_NAME),
+        dict(BART_GENERATION_KWARGS, max_input_length=BART_MAX_INPUT_TOKENS, chunk_max_length=BART_CHUNK_GENERATION_KWARGS["max_length"])
+    )
+    cached = get_cached_summary(cache_key)
+    if cached is not None:
+        print("💾 요약 캐시 적중")
+        return cached["summary"]
+
+    _, tokenizer = get_model("bart_cnn")
+    chunks = group_sentences_by_token_limit(split_text_into_sentences(text), tokenizer, BART_MAX_INPUT_TOKENS)
+    chunk_summaries = []
+    if len(chunks) > 1:
+        print(f"📑 본문 {len(chunks)}개 청크 → 청크별 요약 후 다시 요약")
+        chunk_summaries = [_bart_generate(chunk, BART_CHUNK_GENERATION_KWARGS) for chunk in chunks]
+        text = " ".join(chunk_summaries)
+
+    final_summary = _bart_generate(text, BART_GENERATION_KWARGS)
+    BART_STATS["papers"] += 1
+    put_cached_summary(cache_key, model_cache_name(BART_MODEL_NAME), final_summary, chunk_summaries)
+    return final_summary
+
+# ✅ 여러 논문 요약 → 모든 문장을 한 번에 배치 번역
+def summarize_bart_batch(texts, keywords, post_check=True):
+    if keywords is None or isinstance(keywords, str):
+        keywords = [keywords] * len(texts)
+
+    english_summaries = []
+    for text, keyword in zip(texts, keywords):
+        final_summary = summarize_bart_english(text)
+        if post_check and keyword and not is_relevant(final_summary, keyword):
             print(f"⛔️ 유사도 기준 미달 → 요약 제외")
-            return None
-    else:
-        final_summary = final_summary.replace('\n', ' ')
+            english_summaries.append(None)
+            continue
+        english_summaries.append(final_summary.replace('\n', ' '))
 
     # 요약본 문장 단위 분할
-    sentences = split_text_into_sentences(final_summary)
-    
-    # 분할된 문장 각각 번역
-    translated_sentences = [translate_summaries(sentence) for sentence in sentences]
+    sentence_lists = [
+        [s for s in split_text_into_sentences(summary) if s.strip()] if summary is not None else []
+        for summary in english_summaries
+    ]
 
-    # 최종 요약본 생성
-    final_summary = " ".join(translated_sentences)
+    # 전체 문장을 배치 번역
+    translated = translate_sentences_batch([sentence for sentences in sentence_lists for sentence in sentences])
 
-    return final_summary
\ No newline at end of file
+    # 논문별 최종 요약본 생성
+    results = []
+    offset = 0
+    for summary, sentences in zip(english_summaries, sentence_lists):
+        if summary is None:
+            results.append(None)
+            continue
+        results.append(" ".join(translated[offset:offset + len(sentences)]))
+        offset += len(sentences)
+    return results
+
+# 요약 함수
+def summarize_bart(text, keyword, post_check=True):
+    return summarize_bart_batch([text], [keyword], post_check)[0]
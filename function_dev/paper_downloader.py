@@ -1,20 +1,52 @@
 import feedparser
 from datetime import datetime, timedelta
 import pytz
-import requests
-import io
+import os
 import re
-from pdfminer.high_level import extract_text
+import tempfile
+from urllib.parse import urlencode
+from function_dev.http_client import get_fetch_executor
+from function_dev.http_cache import cached_get
+from function_dev.pdf_extractor import extract_pdf_text_in_pool
+
+PDF_CACHE_TTL = 30 * 86400   # arXiv PDF는 버전별로 내용이 바뀌지 않음
+PDF_ABSTRACT_PAGES = 2        # abstract만 필요할 때 파싱할 앞쪽 페이지 수
+PAPER_FULL_BODY = os.getenv("PAPER_FULL_BODY", "0") == "1"
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ARXIV_FEED_TTL = 3600          # 같은 시간대의 반복 요청은 피드 캐시 사용
+ARXIV_RESULTS_PER_KEYWORD = 10
+
+def download_paper(keyword,day, full_body=PAPER_FULL_BODY):
+    return download_papers([keyword], day, full_body)
+
+def download_papers(keywords, day, full_body=PAPER_FULL_BODY, skip=None):
+    """
+    모든 키워드를 한 번의 arXiv 검색으로 조회하고 arXiv id 기준으로 중복을 제거합니다.
+    기본: arXiv 피드의 abstract(entry.summary)를 그대로 사용하고, 없을 때만 PDF 앞쪽 페이지에서 추출합니다.
+    full_body=True이면 PDF 전체 본문을 파싱합니다.
+    skip(paper)가 True인 논문은 본문을 처리하지 않고 제외합니다.
+    """
+    papers = get_recent_arxiv_pdfs_batch(keywords, day, max_results=ARXIV_RESULTS_PER_KEYWORD * len(keywords))
+    if skip:
+        papers = [paper for paper in papers if not skip(paper)]
 
-def download_paper(keyword,day):
-    papers = get_recent_arxiv_pdfs(keyword,day, max_results=10)
+    # ✅ PDF가 필요한 논문만 동시에 다운로드 + 프로세스 풀에서 파싱
+    pdf_papers = [paper for paper in papers if full_body or not paper.get("abstract")]
+    pdf_bodies = dict(zip(
+        [paper["id"] for paper in pdf_papers],
+        get_fetch_executor().map(lambda paper: extract_body_from_pdf_url(paper["pdf_url"], abstract_only=not full_body), pdf_papers)
+    ))
 
     paper_body = []
 
     for paper in papers:
         print(f"\n⏳ Processing: {paper['title']}")
-        print(f" Extracted url: {paper['pdf_url']}")
-        body_text = extract_body_from_pdf_url(paper['pdf_url'])
+        if paper["id"] in pdf_bodies:
+            print(f" Extracted url: {paper['pdf_url']}")
+            body_text = pdf_bodies[paper["id"]]
+        else:
+            print("⚡ 피드 abstract 사용 (PDF 다운로드 생략)")
+            body_text = paper["abstract"]
         if body_text:
             body_text = body_text.replace('\n', ' ')
             paper["title"] = paper["title"].replace('\n', ' ')
@@ -22,7 +54,9 @@ def download_paper(keyword,day):
             paper_body.append({
             "title": paper["title"],
             "body": body_text,
-            "url": paper["pdf_url"]
+            "url": paper["pdf_url"],
+            "id": paper["id"],
+            "keyword": paper["keyword"]
         })
         else:
             print("❌ Failed to extract body text.")
@@ -30,36 +64,92 @@ def download_paper(keyword,day):
     return paper_body
 
 def get_recent_arxiv_pdfs(keyword,day, max_results=100):
-    query = f"search_query=all:{keyword}&sortBy=submittedDate&sortOrder=descending&max_results={max_results}"
-    url = f"http://export.arxiv.org/api/query?{query}"
-    feed = feedparser.parse(url)
+    return get_recent_arxiv_pdfs_batch([keyword], day, max_results)
+
+# ✅ 키워드 여러 개를 all:a OR all:b ... 하나의 쿼리로 검색
+def build_arxiv_query(keywords):
+    terms = [f'all:"{keyword}"' if " " in keyword else f"all:{keyword}" for keyword in keywords]
+    return " OR ".join(terms)
+
+# ✅ 논문과 가장 먼저 일치하는 키워드 (요약 유사도 검사용)
+def match_keyword(text, keywords):
+    lowered = text.lower()
+    for keyword in keywords:
+        if keyword.lower() in lowered:
+            return keyword
+    return keywords[0]
+
+def get_recent_arxiv_pdfs_batch(keywords, day, max_results=100):
+    keywords = list(dict.fromkeys(keywords))
+    query = urlencode({
+        "search_query": build_arxiv_query(keywords),
+        "sortBy": "submittedDate",
+        "sortOrder": "descending",
+        "max_results": max_results
+    })
+    url = f"{ARXIV_API_URL}?{query}"
+    response = cached_get(url, ttl=ARXIV_FEED_TTL)
+    response.raise_for_status()
+    feed = feedparser.parse(response.content)
 
     now = datetime.utcnow().replace(tzinfo=pytz.utc)
     one_day_ago = now - timedelta(days=day)
 
     papers = []
+    seen_ids = set()
     for entry in feed.entries:
         published = datetime.strptime(entry.published, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=pytz.utc)
         if published >= one_day_ago:
             arxiv_id = entry.id.split('/abs/')[-1]
+
+            # ✅ 버전(v1, v2...)을 제외한 arXiv id 기준 중복 제거
+            base_id = re.sub(r'v\d+$', '', arxiv_id)
+            if base_id in seen_ids:
+                continue
+            seen_ids.add(base_id)
+
             pdf_url = f"https://arxiv.org/pdf/{arxiv_id}.pdf"
+            abstract = re.sub(r'\s+', ' ', entry.get("summary", "")).strip()
             papers.append({
                 "id": arxiv_id,
                 "title": entry.title.strip(),
+                "abstract": abstract,
                 "pdf_url": pdf_url,
-                "published": published.isoformat()
+                "published": published.isoformat(),
+                "keyword": match_keyword(f"{entry.title} {abstract}", keywords)
             })
+    print(f"📚 arXiv 검색: 키워드 {len(keywords)}개 → 고유 논문 {len(papers)}편")
     return papers
 
 
-def extract_body_from_pdf_url(pdf_url):
+# ✅ PDF를 메모리에 모두 올리지 않고 디스크로 스트리밍 (HTTP 캐시 파일이 있으면 그대로 사용)
+def download_pdf_to_file(pdf_url):
+    response = cached_get(pdf_url, ttl=PDF_CACHE_TTL, timeout=15, stream=True)
     try:
-        response = requests.get(pdf_url, timeout=15)
         response.raise_for_status()
-        pdf_bytes = io.BytesIO(response.content)
-        full_text = extract_text(pdf_bytes)
-
-        return extract_abstract(full_text)
+        if response.cache_path:
+            return response.cache_path, False
+        fd, tmp_path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as f:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                f.write(chunk)
+        return tmp_path, True
+    finally:
+        response.close()
+
+
+def extract_body_from_pdf_url(pdf_url, abstract_only=True):
+    try:
+        pdf_path, is_temp = download_pdf_to_file(pdf_url)
+        try:
+            # abstract는 앞쪽 페이지에만 있으므로 전체 문서를 파싱하지 않음
+            max_pages = PDF_ABSTRACT_PAGES if abstract_only else None
+            full_text = extract_pdf_text_in_pool(pdf_path, max_pages=max_pages)
+        finally:
+            if is_temp:
+                os.remove(pdf_path)
+
+        return extract_abstract(full_text) if abstract_only else full_text
 
     except Exception as e:
         print(f"Error extracting PDF from {pdf_url}: {e}")
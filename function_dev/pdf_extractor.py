@@ -0,0 +1,73 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# ✅ PDF 텍스트 추출 설정
+PDF_EXTRACTOR = os.getenv("PDF_EXTRACTOR", "pymupdf")   # "pymupdf" | "pdfminer"
+PDF_MAX_WORKERS = int(os.getenv("PDF_MAX_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+PDF_EXTRACT_TIMEOUT = float(os.getenv("PDF_EXTRACT_TIMEOUT", "120"))
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _extract_pymupdf(path, max_pages=None):
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz as pymupdf   # 예전 버전/일부 배포판은 fitz 모듈만 제공
+    with pymupdf.open(path) as doc:
+        page_count = min(max_pages, doc.page_count) if max_pages else doc.page_count
+        return "\n".join(doc[i].get_text() for i in range(page_count))
+
+
+def _extract_pdfminer(path, max_pages=None):
+    from pdfminer.high_level import extract_text
+    return extract_text(path, maxpages=max_pages or 0)
+
+
+# 작업 프로세스에는 이름이 아니라 함수 자체를 넘기므로 (pickle 가능한) 모듈 최상위 함수만 등록
+EXTRACTORS = {
+    "pymupdf": _extract_pymupdf,
+    "pdfminer": _extract_pdfminer,
+}
+
+
+def register_extractor(name, fn):
+    """fn(path, max_pages)는 작업 프로세스로 pickle되어 전달되므로 모듈 최상위 함수여야 합니다."""
+    EXTRACTORS[name] = fn
+
+
+def _run_extractor(fn, path, max_pages=None):
+    try:
+        return fn(path, max_pages)
+    except ImportError:
+        if fn is _extract_pdfminer:
+            raise
+        return _extract_pdfminer(path, max_pages)
+
+
+def extract_pdf_text(path, max_pages=None, extractor=None):
+    """
+    PDF 파일에서 텍스트를 추출합니다. max_pages가 주어지면 앞쪽 페이지만 파싱합니다.
+    PyMuPDF가 설치되어 있지 않으면 pdfminer로 대체합니다.
+    """
+    return _run_extractor(EXTRACTORS[extractor or PDF_EXTRACTOR], path, max_pages)
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # 다운로드·모델 스레드가 살아 있는 상태에서 fork하면 자식이 잠길 수 있으므로 fork하지 않는 방식 사용
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _executor = ProcessPoolExecutor(max_workers=PDF_MAX_WORKERS, mp_context=multiprocessing.get_context(method))
+        return _executor
+
+
+# ✅ GIL을 막지 않도록 별도 프로세스에서 파싱
+#    작업 프로세스는 fork가 아니라 새로 시작되므로 실행 중 등록한 추출기도 전달되도록 부모에서 함수를 찾아 넘김
+def extract_pdf_text_in_pool(path, max_pages=None, extractor=None, timeout=PDF_EXTRACT_TIMEOUT):
+    future = _get_executor().submit(_run_extractor, EXTRACTORS[extractor or PDF_EXTRACTOR], path, max_pages)
+    return future.result(timeout=timeout)
@@ -0,0 +1,116 @@
+import os
+import math
+from datetime import datetime, timezone
+from sentence_transformers import util
+from function_dev.model_registry import get_model
+from function_dev.text_chunker import split_text_into_sentences
+
+# ✅ 요약 후 유사도 검사(2차 게이트) 사용 여부
+RELEVANCE_POST_CHECK = os.getenv("RELEVANCE_POST_CHECK", "1") == "1"
+
+# ✅ 수집 전 후보 순위 설정
+FETCH_HEADROOM = float(os.getenv("FETCH_HEADROOM", "1.5"))   # 본문 추출 실패에 대비해 top-k보다 더 받아올 비율
+RECENCY_WEIGHT = 0.1
+RECENCY_HALF_LIFE_HOURS = 24.0
+SOURCE_REPEAT_PENALTY = 0.05   # 같은 출처가 상위에 몰리지 않도록 출처별 반복 감점
+
+# ✅ 제목 + 앞부분 문장으로 짧은 요지 생성
+def build_digest(title, text, lead_sentences=3, max_chars=600):
+    sentences = [s for s in split_text_into_sentences(text or "") if s.strip()]
+    lead = " ".join(sentences[:lead_sentences])[:max_chars]
+    return f"{title or ''}. {lead}".strip()
+
+# ✅ 요약 전 유사도 사전 필터
+def prefilter_by_relevance(items, keywords, threshold=0.1, text_key="full_text", title_key="title",
+                           lead_sentences=3, estimate_seconds=None):
+    """
+    제목과 앞부분 문장을 배치로 임베딩해 키워드와의 유사도가 threshold 미만인 항목을 요약 전에 제외합니다.
+    keywords는 단일 키워드 또는 항목별 키워드 리스트이며, (통과 항목 리스트, 리포트 dict)를 반환합니다.
+    estimate_seconds(item)가 주어지면 제외된 항목의 예상 생성 시간을 합산해 리포트에 포함합니다.
+    """
+    report = {"total": len(items), "rejected": 0, "estimated_saved_seconds": 0.0}
+    if not items:
+        return [], report
+    if keywords is None or isinstance(keywords, str):
+        keywords = [keywords] * len(items)
+
+    embedder = get_model("embedder")
+    digests = [build_digest(item.get(title_key, ""), item.get(text_key, ""), lead_sentences) for item in items]
+    unique_keywords = sorted({keyword for keyword in keywords if keyword})
+    if not unique_keywords:
+        return list(items), report
+
+    digest_embeddings = embedder.encode(digests, batch_size=32, convert_to_tensor=True)
+    keyword_embeddings = embedder.encode(unique_keywords, convert_to_tensor=True)
+    similarities = util.cos_sim(digest_embeddings, keyword_embeddings)
+    keyword_index = {keyword: i for i, keyword in enumerate(unique_keywords)}
+
+    kept = []
+    for i, (item, keyword) in enumerate(zip(items, keywords)):
+        if not keyword:
+            kept.append(item)
+            continue
+        similarity = similarities[i][keyword_index[keyword]].item()
+        if similarity >= threshold:
+            kept.append(item)
+            continue
+        print(f"    ⛔️ 사전 필터 제외: {item.get(title_key, '')} (유사도 {similarity:.4f}, 키워드: {keyword})")
+        report["rejected"] += 1
+        if estimate_seconds:
+            report["estimated_saved_seconds"] += estimate_seconds(item)
+
+    print(
+        f"🔎 사전 유사도 필터: {report['total']}개 중 {report['rejected']}개 제외 "
+        f"(절약된 생성 시간 약 {report['estimated_saved_seconds']:.1f}초)"
+    )
+    return kept, report
+
+
+def fetch_budget(top_k, headroom=FETCH_HEADROOM):
+    return max(top_k, math.ceil(top_k * headroom))
+
+def _recency_score(published_at, now):
+    try:
+        published = datetime.fromisoformat((published_at or "").replace("Z", "+00:00"))
+    except ValueError:
+        return 0.0
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    age_hours = max(0.0, (now - published).total_seconds() / 3600)
+    return 0.5 ** (age_hours / RECENCY_HALF_LIFE_HOURS)
+
+# ✅ 수집 전 후보 순위 (이미 받은 메타데이터만 사용)
+def rank_candidates(items, keyword, text_keys=("title", "description"), date_key="publishedAt", source_key="source",
+                    top_k=None):
+    """
+    제목/설명 등 메타데이터를 배치로 임베딩해 키워드 유사도 + 최신성 점수로 정렬하고,
+    같은 출처가 반복될 때마다 감점해 상위 top_k개(없으면 전체)를 점수 순으로 반환합니다.
+    """
+    if not items or not keyword:
+        return list(items)[:top_k] if top_k else list(items)
+
+    embedder = get_model("embedder")
+    texts = [". ".join(item.get(key) or "" for key in text_keys if item.get(key)) for item in items]
+    item_embeddings = embedder.encode(texts, batch_size=32, convert_to_tensor=True)
+    keyword_embedding = embedder.encode([keyword], convert_to_tensor=True)
+    similarities = util.cos_sim(item_embeddings, keyword_embedding)[:, 0].tolist()
+
+    now = datetime.now(timezone.utc)
+    scores = [
+        similarity + RECENCY_WEIGHT * _recency_score(item.get(date_key), now)
+        for item, similarity in zip(items, similarities)
+    ]
+
+    # 점수 순으로 하나씩 고르면서 이미 뽑힌 출처는 감점
+    remaining = list(range(len(items)))
+    source_counts = {}
+    ranked = []
+    while remaining and (not top_k or len(ranked) < top_k):
+        best = max(remaining, key=lambda i: scores[i] - SOURCE_REPEAT_PENALTY * source_counts.get(items[i].get(source_key), 0))
+        remaining.remove(best)
+        source = items[best].get(source_key)
+        source_counts[source] = source_counts.get(source, 0) + 1
+        ranked.append(items[best])
+
+    print(f"🏅 후보 순위: {len(items)}개 중 상위 {len(ranked)}개 선택")
+    return ranked
@@ -0,0 +1,145 @@
+import os
+import re
+import time
+import sqlite3
+import hashlib
+import threading
+from function_dev.cache_paths import cache_path
+from function_dev.http_cache import canonicalize_url
+from function_dev.summary_cache import normalize_text
+
+# ✅ 이전 실행에서 브리핑한 항목 처리 방식
+#    "reuse": 이미 요약한 항목은 다시 받지 않고 이전 요약을 그대로 사용
+#    "new"  : 지난 실행 이후 새로 나온 항목만 브리핑
+#    "off"  : 기록/조회하지 않음
+SEEN_MODE = os.getenv("SEEN_MODE", "reuse")
+SEEN_MAX_AGE_DAYS = float(os.getenv("SEEN_MAX_AGE_DAYS", "30"))
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(cache_path("seen_items.sqlite"), check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS seen_items (
+                key TEXT PRIMARY KEY,
+                pipeline TEXT,
+                title TEXT,
+                url TEXT,
+                summary TEXT,
+                first_seen REAL,
+                last_seen REAL
+            )
+        """)
+        _conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_items_first_seen ON seen_items(first_seen)")
+        _conn.commit()
+    return _conn
+
+
+# ✅ 항목 식별 키: 정규화 URL / 버전 제외 arXiv id / 정규화 본문 해시
+def item_keys(url=None, arxiv_id=None, text=None):
+    keys = []
+    if arxiv_id:
+        keys.append("arxiv:" + re.sub(r'v\d+$', '', arxiv_id))
+    if url:
+        keys.append("url:" + canonicalize_url(url))
+    if text:
+        keys.append("sha:" + hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest())
+    return keys
+
+
+def find_seen(keys):
+    """
+    keys 중 하나라도 기록돼 있으면 {"title", "url", "summary", "first_seen"}를 반환합니다. 없으면 None.
+    """
+    if not keys:
+        return None
+    placeholders = ",".join("?" * len(keys))
+    with _lock:
+        row = _get_conn().execute(
+            f"SELECT title, url, summary, first_seen FROM seen_items WHERE key IN ({placeholders}) "
+            f"AND first_seen >= ? ORDER BY first_seen ASC LIMIT 1",
+            (*keys, time.time() - SEEN_MAX_AGE_DAYS * 86400)
+        ).fetchone()
+    if row is None:
+        return None
+    title, url, summary, first_seen = row
+    return {"title": title, "url": url, "summary": summary, "first_seen": first_seen}
+
+
+def mark_seen(keys, pipeline, title, url, summary):
+    now = time.time()
+    with _lock:
+        conn = _get_conn()
+        for key in keys:
+            # first_seen은 처음 기록한 시각을 유지
+            conn.execute(
+                "INSERT OR IGNORE INTO seen_items VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, pipeline, title, url, summary, now, now)
+            )
+            conn.execute(
+                "UPDATE seen_items SET title = ?, url = ?, summary = ?, last_seen = ? WHERE key = ?",
+                (title, url, summary, now, key)
+            )
+        conn.commit()
+
+
+def evict_seen_items(max_age_days=SEEN_MAX_AGE_DAYS):
+    with _lock:
+        conn = _get_conn()
+        removed = conn.execute(
+            "DELETE FROM seen_items WHERE first_seen < ?", (time.time() - max_age_days * 86400,)
+        ).rowcount
+        conn.commit()
+    if removed:
+        print(f"🧹 브리핑 기록 정리: {removed}건 삭제")
+    return removed
+
+
+class SeenItemTracker:
+    """
+    파이프라인 한 번의 실행 동안 브리핑 기록을 조회/저장합니다.
+    check()가 True를 반환한 항목은 가져오거나 요약할 필요가 없으며, "reuse" 모드에서는 이전 요약이 reused에 쌓입니다.
+    """
+
+    def __init__(self, pipeline, mode=None):
+        self.pipeline = pipeline
+        self.mode = mode or SEEN_MODE
+        self.reused = []
+        self._reused_urls = set()
+
+    def check(self, item, keys):
+        if self.mode == "off":
+            return False
+        record = find_seen(keys)
+        if record is None:
+            return False
+        title = item.get("title") or record["title"]
+        if self.mode == "reuse" and record["summary"]:
+            url = item.get("url") or record["url"]
+            if url not in self._reused_urls:
+                self._reused_urls.add(url)
+                print(f"♻️ 이전 요약 재사용: {title}")
+                self.reused.append({"title": title, "url": url, "summary": record["summary"]})
+        else:
+            print(f"⏭️ 이미 브리핑한 항목 (스킵): {title}")
+        return True
+
+    def select(self, items, keys_fn, limit=None):
+        """
+        "new" 모드는 이미 브리핑한 항목을 뺀 뒤 limit개를 고르고,
+        "reuse" 모드는 limit개를 먼저 고른 뒤 그중 이미 요약한 항목만 재사용합니다.
+        """
+        if self.mode == "new":
+            items = [item for item in items if not self.check(item, keys_fn(item))]
+            return items[:limit] if limit else items
+        items = items[:limit] if limit else items
+        return [item for item in items if not self.check(item, keys_fn(item))]
+
+    def record(self, item, keys, summary):
+        if self.mode == "off" or not summary:
+            return
+        mark_seen(keys, self.pipeline, item.get("title", ""), item.get("url"), summary)
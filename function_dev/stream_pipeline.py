@@ -0,0 +1,121 @@
+import os
+import time
+import queue
+import threading
+from function_dev.http_client import get_fetch_executor
+
+# ✅ 스트리밍 설정
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "8"))        # 다운로드 중 + 요약 대기 중인 항목 상한 (backpressure)
+STREAM_MICRO_BATCH = int(os.getenv("STREAM_MICRO_BATCH", "4"))      # 한 번에 요약할 최대 항목 수
+STREAM_BATCH_WAIT = float(os.getenv("STREAM_BATCH_WAIT", "1.0"))    # 첫 항목 도착 후 배치를 채우며 기다리는 시간(초)
+
+_DONE = object()
+
+
+def stream_pipeline(items, fetch_fn, summarize_batch, accept=None, limit=None, queue_size=STREAM_QUEUE_SIZE,
+                    micro_batch=STREAM_MICRO_BATCH, batch_wait=STREAM_BATCH_WAIT):
+    """
+    items를 공용 다운로드 풀에서 fetch_fn(item)으로 받으면서, 도착하는 대로 micro_batch개씩 summarize_batch로 요약합니다.
+    - fetch_fn(item) → 본문 (None이면 실패로 보고 버림)
+    - accept(item, fetched) → False이면 요약하지 않음 (도착 순서대로 한 번씩 호출)
+    - summarize_batch([(item, fetched), ...]) → 같은 순서의 요약 리스트 (None은 제외된 항목)
+    다운로드 중이거나 요약을 기다리는 항목은 queue_size개를 넘지 않으며,
+    요약이 limit개 나오면 남은 다운로드는 취소합니다. (item, fetched, summary)를 완료 순서대로 yield합니다.
+    limit은 정수 또는 현재 상한을 돌려주는 함수입니다 (도중에 재사용 항목이 생겨 상한이 줄어드는 경우).
+    items를 순회하다 예외가 나면 요약 단계에서 같은 예외를 다시 발생시킵니다.
+    """
+    results = queue.Queue()
+    slots = threading.Semaphore(queue_size)
+    stop = threading.Event()
+    futures = []
+    executor = get_fetch_executor()
+
+    def fetch_one(item):
+        try:
+            fetched = fetch_fn(item)
+        except Exception as e:
+            print(f"❌ 수집 실패: {e}")
+            fetched = None
+        results.put((item, fetched))
+
+    def feed():
+        submitted = 0
+        error = None
+        try:
+            for item in items:
+                slots.acquire()   # 대기 중인 항목이 queue_size개면 요약 단계가 꺼내갈 때까지 다음 다운로드를 미룸
+                if stop.is_set():
+                    break
+                futures.append(executor.submit(fetch_one, item))
+                submitted += 1
+        except Exception as e:
+            error = e   # 후보 생성(검색 등) 실패는 요약 단계에서 다시 발생시킴
+        finally:
+            # 어떤 경우에도 종료 신호를 보내 요약 단계가 무한히 기다리지 않도록 함
+            results.put((_DONE, (submitted, error)))
+
+    threading.Thread(target=feed, daemon=True).start()
+
+    expected = None
+    received = 0
+    pending = []
+    summarized = 0
+    current_limit = limit if callable(limit) else (lambda: limit)
+
+    def take(timeout):
+        nonlocal expected, received
+        try:
+            item, fetched = results.get(timeout=timeout)
+        except queue.Empty:
+            return
+        if item is _DONE:
+            expected, error = fetched
+            if error is not None:
+                raise error
+            return
+        received += 1
+        if fetched is not None and (accept is None or accept(item, fetched)):
+            pending.append((item, fetched))
+        else:
+            slots.release()
+
+    def exhausted():
+        return expected is not None and received >= expected
+
+    def reached():
+        remaining = current_limit()
+        return remaining is not None and summarized >= remaining
+
+    try:
+        while not reached():
+            # 첫 항목은 도착할 때까지 기다리고, 이후 batch_wait 동안 micro_batch개까지 모음
+            deadline = time.time() + batch_wait if pending else None
+            while len(pending) < micro_batch and not exhausted() and not reached():
+                if pending and deadline is None:
+                    deadline = time.time() + batch_wait
+                timeout = max(0.0, deadline - time.time()) if deadline else None
+                if timeout == 0.0:
+                    break
+                take(timeout)
+            if reached() or (not pending and exhausted()):
+                break
+            if not pending:
+                continue
+
+            remaining = current_limit()
+            batch_size = min(micro_batch, remaining - summarized) if remaining is not None else micro_batch
+            batch, pending[:] = pending[:batch_size], pending[batch_size:]
+            print(f"🚚 스트리밍 요약: {len(batch)}개 (수신 {received}개, 대기 {len(pending)}개)")
+            summaries = summarize_batch(batch)
+            for _ in batch:
+                slots.release()   # 요약이 끝난 만큼 다음 다운로드 허용
+            for (item, fetched), summary in zip(batch, summaries):
+                if summary is not None:
+                    summarized += 1
+                yield item, fetched, summary
+    finally:
+        stop.set()
+        slots.release()
+        cancelled = sum(1 for future in list(futures) if future.cancel())
+        if cancelled:
+            print(f"🛑 남은 다운로드 {cancelled}개 취소")
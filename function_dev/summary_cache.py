@@ -0,0 +1,124 @@
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from function_dev.cache_paths import cache_path
+
+# ✅ 캐시 설정
+SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "1") == "1"
+SUMMARY_CACHE_MAX_AGE_DAYS = float(os.getenv("SUMMARY_CACHE_MAX_AGE_DAYS", "30"))
+SUMMARY_CACHE_MAX_MB = float(os.getenv("SUMMARY_CACHE_MAX_MB", "200"))
+EVICT_EVERY_N_WRITES = 50
+
+_lock = threading.Lock()
+_conn = None
+_writes = 0
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(cache_path("summary_cache.sqlite"), check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                model TEXT,
+                summary TEXT,
+                chunk_summaries TEXT,
+                size_bytes INTEGER,
+                created_at REAL,
+                last_access REAL
+            )
+        """)
+        _conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_access ON summaries(last_access)")
+        _conn.commit()
+    return _conn
+
+
+# ✅ 본문 정규화 (공백/유니코드 차이로 캐시를 놓치지 않도록)
+def normalize_text(text):
+    text = unicodedata.normalize("NFC", text or "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+# ✅ 캐시 키: 정규화된 본문 + 모델 + 생성 파라미터의 해시
+def make_cache_key(text, model_name, params):
+    payload = "\x00".join([
+        normalize_text(text),
+        model_name,
+        json.dumps(params, sort_keys=True, ensure_ascii=False)
+    ])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def get_cached_summary(key):
+    """
+    캐시된 요약을 {"summary": ..., "chunk_summaries": [...]} 형태로 반환합니다. 없거나 만료되면 None.
+    """
+    if not SUMMARY_CACHE_ENABLED:
+        return None
+    now = time.time()
+    with _lock:
+        conn = _get_conn()
+        row = conn.execute(
+            "SELECT summary, chunk_summaries, created_at FROM summaries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        summary, chunk_summaries, created_at = row
+        if now - created_at > SUMMARY_CACHE_MAX_AGE_DAYS * 86400:
+            conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (now, key))
+        conn.commit()
+    return {"summary": summary, "chunk_summaries": json.loads(chunk_summaries or "[]")}
+
+
+def put_cached_summary(key, model_name, summary, chunk_summaries=None):
+    global _writes
+    if not SUMMARY_CACHE_ENABLED or summary is None:
+        return
+    chunk_json = json.dumps(chunk_summaries or [], ensure_ascii=False)
+    size_bytes = len(summary.encode("utf-8")) + len(chunk_json.encode("utf-8"))
+    now = time.time()
+    with _lock:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, model_name, summary, chunk_json, size_bytes, now, now)
+        )
+        conn.commit()
+        _writes += 1
+        should_evict = _writes % EVICT_EVERY_N_WRITES == 0
+    if should_evict:
+        evict_summary_cache()
+
+
+# ✅ 오래된 항목 삭제 + 용량 초과 시 가장 오래 안 쓴 항목부터 삭제
+def evict_summary_cache(max_age_days=SUMMARY_CACHE_MAX_AGE_DAYS, max_mb=SUMMARY_CACHE_MAX_MB):
+    max_bytes = max_mb * 1024 * 1024
+    with _lock:
+        conn = _get_conn()
+        expired = conn.execute(
+            "DELETE FROM summaries WHERE created_at < ?", (time.time() - max_age_days * 86400,)
+        ).rowcount
+        total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM summaries").fetchone()[0]
+        removed = 0
+        if total > max_bytes:
+            for key, size_bytes in conn.execute(
+                "SELECT key, size_bytes FROM summaries ORDER BY last_access ASC"
+            ).fetchall():
+                if total <= max_bytes:
+                    break
+                conn.execute("DELETE FROM summaries WHERE key = ?", (key,))
+                total -= size_bytes
+                removed += 1
+        conn.commit()
+    if expired or removed:
+        print(f"🧹 요약 캐시 정리: 만료 {expired}건, 용량 초과 {removed}건 삭제")
+    return expired + removed
@@ -0,0 +1,91 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+from function_dev.cache_paths import cache_path
+from function_dev.synonym_lexicon import load_synonym_lexicon
+
+# ✅ 동의어 캐시 설정 ((키워드, 국가) → 빈도순 동의어 리스트)
+SYNONYM_CACHE_ENABLED = os.getenv("SYNONYM_CACHE_ENABLED", "1") == "1"
+SYNONYM_CACHE_TTL_DAYS = float(os.getenv("SYNONYM_CACHE_TTL_DAYS", "7"))
+
+_lock = threading.Lock()
+_conn = None
+
+
+def _normalize(value):
+    return (value or "").strip().lower()
+
+
+def _get_conn():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(cache_path("synonym_cache.sqlite"), check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS synonyms (
+                keyword TEXT,
+                country TEXT,
+                synonyms TEXT,
+                created_at REAL,
+                PRIMARY KEY (keyword, country)
+            )
+        """)
+        _conn.commit()
+        _seed_from_lexicon(_conn)
+    return _conn
+
+
+# ✅ 처음 연결할 때 오프라인 동의어 사전으로 비어 있는 항목을 채움 (이미 있는 항목은 유지)
+def _seed_from_lexicon(conn):
+    now = time.time()
+    rows = [
+        (_normalize(keyword), _normalize(country), json.dumps(synonyms, ensure_ascii=False), now)
+        for country, entries in load_synonym_lexicon().items()
+        for keyword, synonyms in entries.items()
+    ]
+    seeded = conn.executemany("INSERT OR IGNORE INTO synonyms VALUES (?, ?, ?, ?)", rows).rowcount
+    conn.commit()
+    if seeded > 0:
+        print(f"🌱 동의어 캐시 초기화: 사전 항목 {seeded}건")
+
+
+def get_cached_synonyms(keyword, country):
+    """
+    캐시된 동의어 리스트를 반환합니다. 없거나 TTL이 지났으면 None.
+    """
+    if not SYNONYM_CACHE_ENABLED:
+        return None
+    with _lock:
+        row = _get_conn().execute(
+            "SELECT synonyms, created_at FROM synonyms WHERE keyword = ? AND country = ?",
+            (_normalize(keyword), _normalize(country))
+        ).fetchone()
+    if row is None or time.time() - row[1] > SYNONYM_CACHE_TTL_DAYS * 86400:
+        return None
+    return json.loads(row[0])
+
+
+def put_cached_synonyms(keyword, country, synonyms):
+    if not SYNONYM_CACHE_ENABLED or not synonyms:
+        return
+    with _lock:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO synonyms VALUES (?, ?, ?, ?)",
+            (_normalize(keyword), _normalize(country), json.dumps(synonyms, ensure_ascii=False), time.time())
+        )
+        conn.commit()
+
+
+# ✅ 지금까지 캐시된 동의어를 오프라인 사전 형식(국가 → 키워드 → 리스트)으로 저장
+def export_synonym_cache(path):
+    with _lock:
+        rows = _get_conn().execute("SELECT keyword, country, synonyms FROM synonyms ORDER BY country, keyword").fetchall()
+    lexicon = {}
+    for keyword, country, synonyms in rows:
+        lexicon.setdefault(country, {})[keyword] = json.loads(synonyms)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(lexicon, f, ensure_ascii=False, indent=2)
+    print(f"💾 동의어 사전 저장: {len(rows)}건 → {path}")
+    return lexicon
@@ -2,20 +2,112 @@ import os
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
+from function_dev.llm_factory import get_chat_model
+from function_dev.synonym_cache import get_cached_synonyms, put_cached_synonyms
+from function_dev.synonym_lexicon import lookup_synonyms
 
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# ✅ 동의어 생성 방식: single(한 번의 호출로 검수·정렬된 리스트) | multi(생성 → 검수 → 정렬 3단계) | lexicon(오프라인 사전만 사용)
+SYNONYM_MODE = os.getenv("SYNONYM_MODE", "single")
+
+_llm = None
+
+
+def _get_llm():
+    global _llm
+    if _llm is None:
+        _llm = get_chat_model(
+            ChatOpenAI,
+            model_name="gpt-3.5-turbo",
+            openai_api_key=OPENAI_API_KEY,
+            temperature=0.3,
+        )
+    return _llm
+
+
+def _split_words(text):
+    return [word.strip() for word in text.strip().split(",") if word.strip()]
+
+
+# ✅ 자기 자신 / 다른 후보에 포함되는 단어 / 중복 제거
+def _filter_candidates(keyword, candidates):
+    filtered = []
+    for word in candidates:
+        if keyword in word:  # 자기 자신 제거
+            continue
+        if not any(word in other and word != other for other in candidates):
+            if word not in filtered:
+                filtered.append(word)
+    return filtered
+
 
 def find_synonyms(keyword, n, country):
     if n==1:
         return [keyword]
-    llm = ChatOpenAI(
-        model_name="gpt-3.5-turbo",
-        openai_api_key=OPENAI_API_KEY,
-        temperature=0.3,
+
+    # 캐시(이전 실행 결과 + 오프라인 사전) → 없으면 사전 또는 LLM으로 생성
+    synonyms = get_cached_synonyms(keyword, country)
+    if synonyms is not None:
+        print(f"⚡ 동의어 캐시 사용: {keyword} ({country})")
+    elif SYNONYM_MODE == "lexicon":
+        synonyms = lookup_synonyms(keyword, country) or []
+    else:
+        try:
+            if SYNONYM_MODE == "multi":
+                synonyms = _generate_synonyms_multi_step(keyword, country)
+            else:
+                synonyms = _generate_synonyms(keyword, country)
+        except Exception as e:
+            print(f"❌ 동의어 생성 실패: {e}")
+            synonyms = lookup_synonyms(keyword, country) or []
+        else:
+            put_cached_synonyms(keyword, country, synonyms)
+
+    # 최종 n개만 반환
+    result = [keyword] + [word for word in synonyms if word != keyword]
+    result = result[:n]
+
+    if len(result) < n:
+        print(f"⚠️ Only found {len(result)} valid synonyms (less than requested {n}).")
+    return result
+
+
+# ✅ 한 번의 호출로 검수·빈도순 정렬까지 끝난 리스트 요청
+def _generate_synonyms(keyword, country):
+    prompt = PromptTemplate(
+        input_variables=["keyword", "country"],
+        template="""
+    Please provide a list of up to 10 synonyms for the keyword "{keyword}", ranked from most common to least common.
+
+    Important instructions:
+    - The synonyms must be commonly used in {country}.
+    - Use both the primary local language of {country} and English if English terms are also widely used in {country}.
+    - You should automatically detect the local language based on {country}.
+    - Provide **strict synonyms only** (no related terms, no broader/narrower concepts).
+    - Do not include the keyword itself.
+    - No synonym should be a substring of another synonym.
+    - Order the list by how frequently each synonym is used in {country}, most common first.
+    - List only synonyms, separated by commas.
+
+    Keyword: {keyword}
+    """
     )
 
+    response = (prompt | _get_llm()).invoke({
+        "keyword": keyword,
+        "country": country
+    })
+    print(f"🛠️ Raw synonyms response: {response.content.strip()}")
+    ranked = _filter_candidates(keyword, _split_words(response.content))
+    print(f"🏆 Final sorted list: {ranked}")
+    return ranked
+
+
+def _generate_synonyms_multi_step(keyword, country):
+    llm = _get_llm()
+
     # Step 1️⃣ 동의어 후보군을 충분히 받는다 (ex: 최대 20개 요청)
     gen_prompt = PromptTemplate(
         input_variables=["keyword", "country"],
@@ -47,17 +139,11 @@ def find_synonyms(keyword, n, country):
     print(f"🛠️ Raw synonyms response: {response_text}")
 
     # 후보 리스트 정리
-    candidates = [word.strip() for word in response_text.split(",") if word.strip()]
+    candidates = _split_words(response_text)
     print(f"📋 Initial candidates: {candidates}")
 
     # Step 2️⃣ 포함관계 제거 + 중복 제거
-    filtered = []
-    for word in candidates:
-        if keyword in word:  # 자기 자신 제거
-            continue
-        if not any(word in other and word != other for other in candidates):
-            if word not in filtered:
-                filtered.append(word)
+    filtered = _filter_candidates(keyword, candidates)
     print(f"✅ After filtering substrings & duplicates: {filtered}")
 
     # Step 3️⃣ 검수: 잘못된 항목 제거
@@ -100,19 +186,12 @@ def find_synonyms(keyword, n, country):
     })
     sorted_final = [word.strip() for word in sort_response.content.strip().split(",") if word.strip()]
     print(f"🏆 Final sorted list: {sorted_final}")
-
-    # 최종 n개만 반환
-    result = [keyword] + sorted_final
-    result = result[:n]
-
-    if len(result) < n:
-        print(f"⚠️ Only found {len(result)} valid synonyms (less than requested {n}).")
-    return result
+    return sorted_final
 
 
 # Example usage:
 if __name__ == "__main__":
-    result = find_synonyms("인공지능", n=5)
+    result = find_synonyms("인공지능", n=5, country="Korea")
     print(f"🔍 Final synonym list: {result}")
 
     # ['인공지능', 'AI', '인공신경망', '머신러닝', '딥러닝']
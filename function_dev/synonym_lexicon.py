@@ -0,0 +1,28 @@
+import os
+import json
+
+# ✅ 오프라인 동의어 사전 (국가 → 키워드 → 동의어 리스트)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SYNONYM_LEXICON_PATH = os.getenv("SYNONYM_LEXICON_PATH", os.path.join(BASE_DIR, "sample_synonyms", "synonyms.json"))
+
+_lexicon = None
+
+
+def load_synonym_lexicon(path=SYNONYM_LEXICON_PATH):
+    global _lexicon
+    if _lexicon is None:
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                _lexicon = json.load(f)
+        else:
+            _lexicon = {}
+    return _lexicon
+
+
+def lookup_synonyms(keyword, country):
+    """
+    사전에 등록된 동의어 리스트를 반환합니다. (국가·키워드 모두 대소문자 무시, 없으면 None)
+    """
+    lexicon = load_synonym_lexicon()
+    entries = next((v for k, v in lexicon.items() if k.lower() == (country or "").lower()), {})
+    return next((v for k, v in entries.items() if k.lower() == keyword.strip().lower()), None)
@@ -0,0 +1,43 @@
+import re
+
+# ✅ 문장 단위 분할
+def split_text_into_sentences(text):
+    return re.split(r'(?<=[.!?])\s+', text)
+
+# ✅ 문장별 토큰 수 계산 (문장당 한 번만 토크나이즈)
+def count_sentence_tokens(sentences, tokenizer):
+    if not sentences:
+        return []
+    # 그룹 안에서는 문장이 공백으로 이어지므로 앞에 공백을 붙여 토크나이즈
+    encoded = tokenizer([" " + sentence for sentence in sentences], add_special_tokens=False)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+# ✅ 누적 토큰 수 기준 패킹 (선형 시간)
+def pack_by_token_counts(token_counts, max_tokens, special_tokens=0):
+    """
+    문장별 토큰 수를 앞에서부터 누적해 max_tokens를 넘지 않도록 묶고,
+    각 그룹의 (시작, 끝) 인덱스 리스트를 반환합니다.
+    한 문장이 단독으로 max_tokens를 넘으면 그 문장만으로 그룹을 만듭니다.
+    """
+    spans = []
+    start = 0
+    current = 0
+    for i, count in enumerate(token_counts):
+        if i > start and current + count + special_tokens > max_tokens:
+            spans.append((start, i))
+            start = i
+            current = 0
+        current += count
+    if start < len(token_counts):
+        spans.append((start, len(token_counts)))
+    return spans
+
+# ✅ 문장 토큰 기준 그룹화 (기존 group_sentences_by_token_limit과 같은 출력)
+def group_sentences_by_token_limit(sentences, tokenizer, max_tokens):
+    sentences = [sentence for sentence in sentences if sentence.strip()]
+    token_counts = count_sentence_tokens(sentences, tokenizer)
+    special_tokens = tokenizer.num_special_tokens_to_add()
+    return [
+        " ".join(sentences[start:end]).strip()
+        for start, end in pack_by_token_counts(token_counts, max_tokens, special_tokens)
+    ]
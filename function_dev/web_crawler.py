@@ -1,9 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
-import re
-import time
 import os
+import re
+from bs4 import BeautifulSoup
 from dotenv import load_dotenv
+from function_dev.http_client import fetch, decode_html
+from function_dev.http_cache import cached_get
 
 # Google CSE 정보 입력
 API_KEY = os.getenv("API_KEY")
@@ -11,44 +11,48 @@ CSE_ID = os.getenv("CSE_ID")
 
 MIN_CONTENT_LENGTH = 500
 
-def search_tistory_google(keyword, days, max_results=10):
-    links = []
+# Step 1: Google CSE 검색 (10개씩 페이지 단위로 필요할 때만 요청)
+def iter_tistory_search_pages(keyword, days, max_results=10):
+    found = 0
     start_index = 1
 
-    while len(links) < max_results:
+    while found < max_results:
         url = (
             f"https://www.googleapis.com/customsearch/v1"
             f"?key={API_KEY}&cx={CSE_ID}&q={keyword}&start={start_index}&sort=date&dateRestrict=d{days}"
         )
-        res = requests.get(url)
-        data = res.json()
+        data = fetch(url).json()   # API 쿼터 보호: 같은 도메인 요청 간격은 http_client에서 제한
 
         items = data.get("items", [])
         if not items:
             break
 
+        links = []
         for item in items:
             link = item.get("link", "")
             if "tistory.com" in link:
-                title = item.get("title", "").strip()
                 links.append({
                     "url": link,
-                    "title": title
+                    "title": item.get("title", "").strip(),
+                    "snippet": item.get("snippet", "").strip()
                 })
-                if len(links) >= max_results:
+                found += 1
+                if found >= max_results:
                     break
+        if links:
+            yield links
 
         start_index += 10
-        time.sleep(1)  # API 쿼터 보호
 
-    return links
+
+def search_tistory_google(keyword, days, max_results=10):
+    return [link for links in iter_tistory_search_pages(keyword, days, max_results) for link in links]
 
 # Step 2: 티스토리 본문 추출
 def extract_tistory_content(url):
-    headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        res = requests.get(url, headers=headers, timeout=5)
-        soup = BeautifulSoup(res.text, 'html.parser')
+        res = cached_get(url, timeout=5)
+        soup = BeautifulSoup(decode_html(res), 'html.parser')
 
         content_div = (
             soup.find("div", class_=re.compile("tt_article_useless_p_margin|entry-content|article-view")) or
@@ -63,27 +67,3 @@ def extract_tistory_content(url):
             return "❌ 본문을 찾을 수 없습니다."
     except Exception as e:
         return f"⚠️ 오류 발생: {e}"
-
-# Step 3: 실행 예시
-def crawl_tistory_blogs_google(keyword, days, max_results=10):
-    blog_links = search_tistory_google(keyword, days, max_results)
-    extracted = []
-
-    for item in blog_links:
-        url = item["url"]
-        title = item["title"]
-        print(f"📘 크롤링 중: {title} ({url})")
-        content = extract_tistory_content(url)
-
-        if len(content) < MIN_CONTENT_LENGTH:
-            print(f"⏭️ 스킵: '{item['title']}' (본문 너무 짧음, {len(content)}자)")
-            continue
-
-        extracted.append({
-            "title": title,
-            "url": url,
-            "full_text": content
-        })
-        time.sleep(1)
-
-    return extracted
\ No newline at end of file
@@ -3,7 +3,6 @@ import os
 import re
 import json
 import time
-import threading
 from dotenv import load_dotenv
 from agent import agent
 from datetime import datetime
@@ -11,11 +10,18 @@ from datetime import datetime
 from function_dev.pdf_creator import export_json_to_pdf
 from function_dev.email_sender import send_email_with_pdf
 from function_dev.json_to_vectordb import run_vector_pipeline
+from function_dev.model_registry import unload_idle_models
+from function_dev.seen_store import evict_seen_items
+from function_dev.llm_factory import get_chat_model
+from function_dev.intent_router import route_request, record_route, detect_sources
+from function_dev.job_executor import get_job_executor, JobQueueFull
+from module.Briefing import SOURCE_LABELS
 from module.wrapper import (
     News_pipeline_wrapped,
     Blogs_pipeline_wrapped,
     Paper_pipeline_wrapped,
-    set_web_params
+    Briefing_pipeline_wrapped,
+    request_context
 )
 from langchain_community.chat_models import ChatOpenAI
 from langchain.agents import initialize_agent, AgentType
@@ -24,31 +30,37 @@ from langchain.tools import StructuredTool
 
 # 소스 추론
 def infer_source_type(prompt: str) -> str:
-    prompt = prompt.lower()
-    if any(k in prompt for k in ["뉴스", "기사", "보도", "news"]):
-        return "news"
-    elif any(k in prompt for k in ["블로그", "blog"]):
-        return "blog"
-    elif any(k in prompt for k in ["논문", "paper", "학술자료"]):
-        return "paper"
-    return "unknown"
+    sources = detect_sources(prompt)
+    return sources[0] if sources else "unknown"
 
 # 요약 결과 파싱
 def parse_news_output(output: str):
     blocks = output.strip().split("\n\n")
     parsed_items = []
+    current_source = None
 
     for block in blocks:
+        # 통합 브리핑: "### 📰 뉴스" 같은 섹션 제목 이후 항목은 해당 소스로 표시
+        for line in block.splitlines():
+            heading = line.strip().lstrip("#").strip()
+            current_source = next(
+                (source for source, label in SOURCE_LABELS.items() if line.strip().startswith("#") and label in heading),
+                current_source
+            )
+
         title_match = re.search(r"\*\*(.+?)\*\*", block) or re.search(r"\[(.+?)\]\(", block)
         url_match = re.search(r"\((https?://[^\s]+)\)", block)
         summary_match = re.findall(r"-\s(.+)", block)
 
         if title_match and url_match:
-            parsed_items.append({
+            item = {
                 "title": title_match.group(1).strip(),
                 "url": url_match.group(1).strip(),
                 "summary": " ".join(summary_match).strip() if summary_match else ""
-            })
+            }
+            if current_source:
+                item["source"] = current_source
+            parsed_items.append(item)
 
     return parsed_items
 
@@ -56,16 +68,27 @@ def parse_news_output(output: str):
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# 툴 결과는 에이전트 LLM이 다시 작성하지 않고 그대로 반환 (구조화된 결과는 요청 컨텍스트로 전달)
 tools = [
-    StructuredTool.from_function(News_pipeline_wrapped, name="crawl_news",
+    StructuredTool.from_function(News_pipeline_wrapped, name="crawl_news", return_direct=True,
         description="뉴스를 크롤링하고 요약하는 파이프라인. '뉴스', '기사', '보도', 'news' 요청 시 사용"),
-    StructuredTool.from_function(Blogs_pipeline_wrapped, name="crawl_blog",
+    StructuredTool.from_function(Blogs_pipeline_wrapped, name="crawl_blog", return_direct=True,
         description="블로그 글을 크롤링하고 요약하는 파이프라인. '블로그', 'blog' 요청 시 사용"),
-    StructuredTool.from_function(Paper_pipeline_wrapped, name="crawl_papers",
-        description="논문을 크롤링하고 요약하는 파이프라인. '논문', 'paper', '학술자료' 요청 시 사용")
+    StructuredTool.from_function(Paper_pipeline_wrapped, name="crawl_papers", return_direct=True,
+        description="논문을 크롤링하고 요약하는 파이프라인. '논문', 'paper', '학술자료' 요청 시 사용"),
+    StructuredTool.from_function(Briefing_pipeline_wrapped, name="crawl_briefing", return_direct=True,
+        description="뉴스·블로그·논문을 동시에 크롤링해 하나로 요약하는 통합 브리핑. '브리핑', '종합', '전체', 'briefing' 요청 시 사용")
 ]
 
-llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0, openai_api_key=OPENAI_API_KEY)
+# 빠른 경로에서 바로 실행할 파이프라인 (route_request의 source → 툴)
+FAST_PATH_TOOLS = {
+    "news": News_pipeline_wrapped,
+    "blog": Blogs_pipeline_wrapped,
+    "paper": Paper_pipeline_wrapped,
+    "briefing": Briefing_pipeline_wrapped,
+}
+
+llm = get_chat_model(ChatOpenAI, model="gpt-3.5-turbo", temperature=0, openai_api_key=OPENAI_API_KEY)
 
 system_message = """
 너는 뉴스, 블로그, 논문 자료를 크롤링하고 요약하는 AI 에이전트야.
@@ -84,52 +107,86 @@ agent = initialize_agent(
 )
 
 
+# 브리핑 작업 (작업 실행기 스레드에서 요청별 설정으로 실행)
+def run_briefing_job(prompt, country, synonym_range, email):
+    # 소스/키워드/기간이 확실한 요청은 에이전트 없이 파이프라인 바로 실행
+    route = route_request(prompt)
+    record_route(route is not None)
+    with request_context(synonym_range, country) as ctx:
+        if route:
+            source_type, keyword, days = route
+            print(f"🧭 빠른 경로: {source_type} / {keyword} / {days}일")
+            FAST_PATH_TOOLS[source_type](keyword, days)
+        else:
+            result = agent.invoke(prompt, return_only_outputs=True)
+            print(result)
+    # 툴이 실행됐으면 파이프라인 결과를 그대로 사용, 아니면 에이전트 답변 텍스트에서 파싱
+    parsed = ctx.results
+    if not parsed and not route and isinstance(result["output"], str):
+        parsed = parse_news_output(result["output"])
+    print(parsed)
+
+    # JSON 저장
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    save_dir = os.path.join(base_dir, "json_data")
+    os.makedirs(save_dir, exist_ok=True)
+
+    source_type = route[0] if route else infer_source_type(prompt)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    file_path = os.path.join(save_dir, f"{source_type}_summary_{timestamp}.json")
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(parsed, f, ensure_ascii=False, indent=4)
+
+    # PDF + 이메일 전송
+    if email.strip():
+        pdf_path = export_json_to_pdf(parsed)
+        send_email_with_pdf(email, pdf_path)
+
+    # 벡터화
+    run_vector_pipeline(json_data_dir=save_dir)
+
+    # 오래 쓰지 않은 모델 해제 + 보관 기간이 지난 브리핑 기록 삭제
+    unload_idle_models()
+    evict_seen_items()
+    return parsed
+
+
 # 파이프라인 실행 함수
 def run_pipeline(prompt, country, synonym_range, email):
     start_time = time.time()
-    result_holder = {"done": False, "result": None}
 
-    def task():
-        set_web_params(synonym_range, country)
-        result = agent.invoke(prompt, return_only_outputs=True)
-        print(result)
-        parsed = parse_news_output(result["output"])
-        print(parsed)
-        result_holder["result"] = parsed
-        result_holder["done"] = True
-
-        # JSON 저장
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        save_dir = os.path.join(base_dir, "json_data")
-        os.makedirs(save_dir, exist_ok=True)
-        
-        source_type = infer_source_type(prompt)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        file_path = os.path.join(save_dir, f"{source_type}_summary_{timestamp}.json")
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(parsed, f, ensure_ascii=False, indent=4)
-
-        # PDF + 이메일 전송
-        if email.strip():
-            pdf_path = export_json_to_pdf(parsed)
-            send_email_with_pdf(email, pdf_path)
-
-        # 벡터화
-        run_vector_pipeline(json_data_dir=save_dir)
-
-    thread = threading.Thread(target=task)
-    thread.start()
-
-    # 실시간 상태 표시
-    while not result_holder["done"]:
+    # 실행/대기 자리가 모두 차 있으면 바로 거절
+    try:
+        job = get_job_executor().submit(run_briefing_job, prompt, country, synonym_range, email)
+    except JobQueueFull:
+        yield "<div style='text-align:center; margin-top: 20px;'>🚦 현재 요청이 많아 접수할 수 없습니다.<br><small>잠시 후 다시 시도해주세요.</small></div>"
+        return
+
+    # 실시간 상태 표시 (대기 순번 → 실행 경과 시간)
+    while not job.wait(timeout=1):
         elapsed = int(time.time() - start_time)
-        yield f"<div style='text-align:center; margin-top: 20px;'>⏳ 에이전트 실행 중입니다...<br><small>경과 시간: {elapsed}초</small></div>"
-        time.sleep(1)
+        position = job.position()
+        if position:
+            yield f"<div style='text-align:center; margin-top: 20px;'>🕒 대기 중입니다... (앞에 {position - 1}건)<br><small>경과 시간: {elapsed}초</small></div>"
+        else:
+            yield f"<div style='text-align:center; margin-top: 20px;'>⏳ 에이전트 실행 중입니다...<br><small>경과 시간: {elapsed}초</small></div>"
 
-    # 최종 결과 표시
     elapsed = int(time.time() - start_time)
+    try:
+        parsed = job.result()
+    except Exception as e:
+        print(f"❌ 브리핑 실패: {e}")
+        yield f"<div style='text-align:center; margin-top: 20px;'>❌ <b>작업 중 오류가 발생했습니다.</b><br><small>{e}</small></div>"
+        return
+
+    # 최종 결과 표시
     output_md = f"<div style='text-align:center; margin-top: 20px;'>✅ <b>작업이 완료되었습니다!</b><br><small>총 경과 시간: {elapsed}초</small></div><br><br>"
-    for i, item in enumerate(result_holder["result"], 1):
+    current_source = None
+    for i, item in enumerate(parsed, 1):
+        # 통합 브리핑 결과는 소스별 섹션으로 구분
+        if item.get("source") and item["source"] != current_source:
+            current_source = item["source"]
+            output_md += f"### {SOURCE_LABELS.get(current_source, current_source)}\n\n"
         output_md += f"**{i}. [{item['title']}]({item['url']})**\n\n- {item['summary']}\n\n"
     yield output_md
 
@@ -147,7 +204,10 @@ with gr.Blocks() as demo:
     submit = gr.Button("🚀 실행")
     output = gr.Markdown(label="📄 결과")
 
-    submit.click(fn=run_pipeline, inputs=[prompt, country, synonym_range, email], outputs=output)
+    # 동시 실행/대기 제한과 초과 요청 거절은 작업 실행기가 맡으므로 Gradio 쪽에서는 제한하지 않음
+    #    (핸들러는 작업 상태만 확인하므로 가벼움)
+    submit.click(fn=run_pipeline, inputs=[prompt, country, synonym_range, email], outputs=output,
+                 concurrency_limit=None)
 
 if __name__ == "__main__":
     demo.launch(share=True)
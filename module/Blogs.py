@@ -1,86 +1,159 @@
 import sys
-import random
 sys.path.append("E:\Daily_AI_Briefing_Service")
 
 from function_dev.synonym_finder import find_synonyms
-from function_dev.web_crawler import crawl_tistory_blogs_google
-from function_dev.blog_summarizer import hierarchical_summary, is_relevant
+from function_dev.web_crawler import search_tistory_google, extract_tistory_content, MIN_CONTENT_LENGTH
+from function_dev.batch_summarizer import batch_hierarchical_summary, estimate_generation_seconds
+from function_dev.relevance_filter import prefilter_by_relevance, rank_candidates, RELEVANCE_POST_CHECK
+from function_dev.near_duplicate import NearDuplicateIndex
+from function_dev.seen_store import SeenItemTracker, item_keys
+from function_dev.stream_pipeline import stream_pipeline
 from rouge_score import rouge_scorer
 
-def Blogs_pipeline(keyword, days, n=1, country='Korea'):
-    keywords = find_synonyms(keyword, n, country)
+BLOGS_PER_KEYWORD = 5
+
+def Blogs_pipeline(keyword, days, n=1, country='Korea', keywords=None):
+    keywords = keywords or find_synonyms(keyword, n, country)
     summarized_blogs = []
     seen_urls = set()   # ✅ 중복 방지용
+    seen = SeenItemTracker("blog")
 
     scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
     rouge_scores = []  # 각 기사별 점수 저장용
-
-    for keyword in keywords:
-        blogs = crawl_tistory_blogs_google(keyword, days, 5)
-        random.shuffle(blogs)  # ✅ 블로그 순서를 모두 섞고 앞의 5개만 선택
-        blogs = blogs[:5]
-        
-        for idx, blog in enumerate(blogs, 1):
-            title = blog.get("title", "")
-            full_text = blog.get("full_text", "").strip()
-            url = blog.get("url")
-
-            if not full_text:
-                print(f"\n[{idx}] ⚠️ {title}: 본문 없음 (스킵)")
-                continue
-
-            # ✅ URL 기준 중복 제거
-            if url in seen_urls:
-                print(f"\n[{idx}] 🚫 {title}: 이미 처리된 블로그 (중복 스킵)")
-                continue
-            seen_urls.add(url)
-
-            print(f"\n[{idx}] 📰 {title}")
-            print(f"📄 본문 길이: {len(full_text)}자")
-
-            try:
-                summary = hierarchical_summary(full_text, keyword)
-                if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
-                    print(f"⚠️ {title}: 키워드와 무관한 블로그")
+    near_duplicates = NearDuplicateIndex()
+    kept = {keyword: 0 for keyword in keywords}        # 키워드별 요약까지 살아남은(또는 재사용한) 블로그 수
+    in_flight = {keyword: 0 for keyword in keywords}   # 키워드별 요약을 기다리는 블로그 수
+
+    # ✅ 이전 실행에서 브리핑한 글인지 확인하고, 이전 요약을 재사용했으면 해당 키워드의 개수에 포함
+    def check_seen(item, keyword, keys):
+        reused_before = len(seen.reused)
+        if not seen.check(item, keys):
+            return False
+        kept[keyword] += len(seen.reused) - reused_before
+        return True
+
+    # ✅ 키워드별 검색 결과를 제목·스니펫 유사도 순으로 내보냄 (다음 키워드 검색 중에도 앞 키워드 본문 추출은 진행)
+    #    URL 중복 / 이전 실행에서 브리핑한 글은 본문을 받기 전에 제외
+    #    요약 단계에서 제외되는 글이 있을 수 있으므로 실제로 5개가 남을 때까지 계속 내보냄
+    def iter_candidates():
+        for keyword in keywords:
+            links = rank_candidates(search_tistory_google(keyword, days, max_results=10), keyword,
+                                    text_keys=("title", "snippet"))
+            for link in links:
+                # 재사용 포함 5개가 남은 키워드는 더 확인하지 않음
+                if kept[keyword] >= BLOGS_PER_KEYWORD:
+                    break
+                if link["url"] in seen_urls:
+                    print(f"🚫 {link['title']}: 이미 처리된 블로그 (중복 스킵)")
                     continue
-
-                print(f"✅ 최종 요약 완료:\n{summary[:500]}...")
-
-                # ROUGE 계산
-                score = scorer.score(full_text, summary)
-                rouge_scores.append(score)
-
-                print(f"📊 ROUGE-1: {score['rouge1']}")
-                print(f"📊 ROUGE-2: {score['rouge2']}")
-                print(f"📊 ROUGE-L: {score['rougeL']}")
-
-                summarized_blogs.append({
-                    "title": title,
-                    "url": url,
-                    "summary": summary
-                })
-            except Exception as e:
-                print(f"❌ 요약 실패: {e}")
-
-        # 최종 평균 ROUGE 계산
-        if rouge_scores:
-            avg_rouge = {}
-            for metric in ['rouge1', 'rouge2', 'rougeL']:
-                avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
-                avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
-                avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
-
-                avg_rouge[metric] = {
-                    'precision': avg_precision,
-                    'recall': avg_recall,
-                    'f1': avg_f1
-                }
-
-            print("\n=== 📈 최종 평균 ROUGE ===")
-            for metric, values in avg_rouge.items():
-                print(
-                    f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
-        else:
-            print("❗️ 평가할 요약이 없습니다.")
-
-    return summarized_blogs
\ No newline at end of file
+                seen_urls.add(link["url"])
+                if check_seen(link, keyword, item_keys(url=link["url"])):
+                    continue
+                yield dict(link, keyword=keyword)
+
+    def fetch_blog(link):
+        # 이미 요약된 블로그 5개가 남은 키워드는 본문을 받지 않음
+        if kept[link["keyword"]] >= BLOGS_PER_KEYWORD:
+            return None
+        print(f"📘 크롤링 중: {link['title']} ({link['url']})")
+        content = extract_tistory_content(link["url"]).strip()
+        if len(content) < MIN_CONTENT_LENGTH:
+            print(f"⏭️ 스킵: '{link['title']}' (본문 너무 짧음, {len(content)}자)")
+            return None
+        return content
+
+    # ✅ 본문이 도착하는 순서대로 확인 (이미 브리핑 / 유사 중복 / 키워드별 개수 초과면 제외)
+    #    요약 대기 중인 글도 개수에 포함해 필요 이상 요약하지 않고, 요약에서 제외되면 그 자리를 다음 글이 채움
+    def accept(blog, full_text):
+        title = blog.get("title", "")
+        if kept[blog["keyword"]] + in_flight[blog["keyword"]] >= BLOGS_PER_KEYWORD:
+            return False
+        # URL은 달라도 본문이 같은 글을 이미 브리핑했는지 확인
+        if check_seen(blog, blog["keyword"], item_keys(text=full_text)):
+            return False
+        # URL이 달라도 본문이 거의 같은 블로그(퍼가기·재게시)는 먼저 도착한 것만 남김
+        if not near_duplicates.add(full_text, title):
+            return False
+        in_flight[blog["keyword"]] += 1
+        print(f"\n📰 {title}")
+        print(f"📄 본문 길이: {len(full_text)}자")
+        return True
+
+    # ✅ 모인 블로그 묶음마다 무관한 글을 거른 뒤 배치 요약
+    def summarize(batch):
+        blogs = [dict(blog, full_text=full_text) for blog, full_text in batch]
+        kept, _ = prefilter_by_relevance(
+            blogs, [blog["keyword"] for blog in blogs], threshold=0.2,
+            estimate_seconds=lambda blog: estimate_generation_seconds(blog.get("full_text", ""))
+        )
+        kept_ids = {id(blog) for blog in kept}
+        kept_idx = [i for i, blog in enumerate(blogs) if id(blog) in kept_ids]
+
+        summaries = [None] * len(batch)
+        if not kept_idx:
+            return summaries
+        try:
+            outputs = batch_hierarchical_summary(
+                [blogs[i]["full_text"] for i in kept_idx],
+                [blogs[i]["keyword"] for i in kept_idx],
+                threshold=0.2,
+                post_check=RELEVANCE_POST_CHECK
+            )
+        except Exception as e:
+            print(f"❌ 요약 실패: {e}")
+            outputs = [None] * len(kept_idx)
+        for i, summary in zip(kept_idx, outputs):
+            summaries[i] = summary
+        return summaries
+
+    # ✅ 본문 추출과 요약을 겹쳐서 실행하고 완료 순서대로 결과 수집
+    results = stream_pipeline(iter_candidates(), fetch_blog, summarize, accept=accept,
+                              limit=lambda: max(0, BLOGS_PER_KEYWORD * len(keywords) - len(seen.reused)))
+    for blog, full_text, summary in results:
+        title = blog.get("title", "")
+        in_flight[blog["keyword"]] -= 1
+
+        if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
+            print(f"⚠️ {title}: 키워드와 무관한 블로그")
+            continue
+
+        kept[blog["keyword"]] += 1
+        print(f"✅ 최종 요약 완료:\n{summary[:500]}...")
+        seen.record(blog, item_keys(url=blog.get("url"), text=full_text), summary)
+
+        # ROUGE 계산
+        score = scorer.score(full_text, summary)
+        rouge_scores.append(score)
+
+        print(f"📊 ROUGE-1: {score['rouge1']}")
+        print(f"📊 ROUGE-2: {score['rouge2']}")
+        print(f"📊 ROUGE-L: {score['rougeL']}")
+
+        summarized_blogs.append({
+            "title": title,
+            "url": blog.get("url"),
+            "summary": summary
+        })
+
+    # 최종 평균 ROUGE 계산
+    if rouge_scores:
+        avg_rouge = {}
+        for metric in ['rouge1', 'rouge2', 'rougeL']:
+            avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
+            avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
+            avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
+
+            avg_rouge[metric] = {
+                'precision': avg_precision,
+                'recall': avg_recall,
+                'f1': avg_f1
+            }
+
+        print("\n=== 📈 최종 평균 ROUGE ===")
+        for metric, values in avg_rouge.items():
+            print(
+                f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
+    else:
+        print("❗️ 평가할 요약이 없습니다.")
+
+    return seen.reused + summarized_blogs
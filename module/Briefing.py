@@ -0,0 +1,48 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from function_dev.synonym_finder import find_synonyms
+from function_dev.relevance_filter import rank_candidates
+from module.News import News_pipeline
+from module.Blogs import Blogs_pipeline
+from module.Paper import Paper_pipeline
+
+# ✅ 소스별 파이프라인 (출력 순서 = 섹션 순서)
+BRIEFING_SOURCES = {
+    "news": ("📰 뉴스", News_pipeline),
+    "blog": ("📝 블로그", Blogs_pipeline),
+    "paper": ("📚 논문", Paper_pipeline),
+}
+SOURCE_LABELS = {source: label for source, (label, _) in BRIEFING_SOURCES.items()}
+
+def Briefing_pipeline(keyword, days, n=1, country='Korea', sources=tuple(BRIEFING_SOURCES)):
+    """
+    뉴스·블로그·논문 파이프라인을 동시에 실행해 하나의 브리핑으로 합칩니다.
+    동의어는 한 번만 찾아 공유하고, 다운로드는 공용 다운로드 풀, 요약 생성은 공용 모델 실행기에서 처리하므로
+    전체 소요 시간은 세 소스의 합이 아니라 가장 느린 소스에 가깝습니다.
+    결과는 소스 섹션 순서대로, 섹션 안에서는 키워드 유사도 순으로 정렬되며 각 항목에 "source"가 붙습니다.
+    """
+    keywords = find_synonyms(keyword, n, country)
+    start = time.time()
+
+    def run(source):
+        label, pipeline = BRIEFING_SOURCES[source]
+        source_start = time.time()
+        try:
+            items = pipeline(keyword, days, n, country, keywords=keywords) or []
+        except Exception as e:
+            print(f"❌ {label} 파이프라인 실패: {e}")
+            items = []
+        print(f"⏱️ {label}: {len(items)}건, {time.time() - source_start:.1f}초")
+        return items
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        results = dict(zip(sources, executor.map(run, sources)))
+
+    briefing = []
+    for source in sources:
+        ranked = rank_candidates(results[source], keyword, text_keys=("title", "summary"), date_key=None, source_key=None)
+        briefing += [dict(item, source=source) for item in ranked]
+
+    print(f"\n✅ 통합 브리핑 완료: {len(briefing)}건, {time.time() - start:.1f}초")
+    return briefing
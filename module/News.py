@@ -1,79 +1,121 @@
 from function_dev.synonym_finder import find_synonyms
 from function_dev.News_collector import fetch_data_newsapi
-from function_dev.News_fetch_full_articles import process_articles
-from function_dev.News_summarizer import hierarchical_summary
+from function_dev.News_fetch_full_articles import fetch_full_article_auto
+from function_dev.batch_summarizer import batch_hierarchical_summary, estimate_generation_seconds
+from function_dev.relevance_filter import prefilter_by_relevance, rank_candidates, fetch_budget, RELEVANCE_POST_CHECK
+from function_dev.near_duplicate import NearDuplicateIndex
+from function_dev.seen_store import SeenItemTracker, item_keys
+from function_dev.stream_pipeline import stream_pipeline
 from rouge_score import rouge_scorer
 
-import random
+NEWS_TOP_K = 5
 
-def News_pipeline(keyword, days, n=1, country='Korea'):
-    keywords = find_synonyms(keyword, n, country)
+def News_pipeline(keyword, days, n=1, country='Korea', keywords=None):
+    keywords = keywords or find_synonyms(keyword, n, country)
     all_articles = fetch_data_newsapi(keywords, days)
-    
-    # 기사 순서를 모두 섞고 앞의 5개만 선택
-    random.shuffle(all_articles)
-    all_articles = all_articles[:5]
-    
-    full_articles = process_articles(all_articles)
+    seen = SeenItemTracker("news")
+
+    # ✅ 제목·설명·최신성·출처로 순위를 매겨 상위 기사만 본문 수집 (실패 대비 여유분 포함)
+    #    이전 실행에서 브리핑한 기사는 본문을 다시 받지 않음
+    all_articles = rank_candidates(all_articles, keyword)
+    all_articles = seen.select(all_articles, lambda article: item_keys(url=article.get("url")),
+                               limit=fetch_budget(NEWS_TOP_K))
 
     scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
     rouge_scores = []  # 각 기사별 점수 저장용
+    near_duplicates = NearDuplicateIndex()
 
-    summarized_articles = []
-    for idx, article in enumerate(full_articles, 1):
-        title = article.get("title", "")
-        full_text = article.get("full_text", "").strip()
+    def fetch_article(article):
+        return (fetch_full_article_auto(article.get("url")) or "").strip()
 
+    # ✅ 본문이 도착하는 순서대로 확인 (본문 없음 / 이미 브리핑 / 유사 중복이면 제외)
+    def accept(article, full_text):
+        title = article.get("title", "")
         if not full_text:
-            print(f"\n[{idx}] ⚠️ {title}: 본문 없음 (스킵)")
-            continue
-
-        print(f"\n[{idx}] 📰 {title}")
+            print(f"\n⚠️ {title}: 본문 없음 (스킵)")
+            return False
+        # URL은 달라도 본문이 같은 기사를 이미 브리핑했는지 확인
+        if seen.check(article, item_keys(text=full_text)):
+            return False
+        # 제목·URL이 달라도 본문이 거의 같은 기사(전재·재배포)는 먼저 도착한 것만 남김
+        if not near_duplicates.add(full_text, title):
+            return False
+        print(f"\n📰 {title}")
         print(f"📄 본문 길이: {len(full_text)}자")
+        return True
+
+    # ✅ 모인 기사 묶음마다 무관한 기사를 거른 뒤 배치 요약
+    def summarize(batch):
+        articles = [dict(article, full_text=full_text) for article, full_text in batch]
+        kept, _ = prefilter_by_relevance(
+            articles, keyword, threshold=0.1,
+            estimate_seconds=lambda article: estimate_generation_seconds(article.get("full_text", ""))
+        )
+        kept_ids = {id(article) for article in kept}
+        kept_idx = [i for i, article in enumerate(articles) if id(article) in kept_ids]
 
+        summaries = [None] * len(batch)
+        if not kept_idx:
+            return summaries
         try:
-            summary = hierarchical_summary(full_text,keyword)
-            if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
-                print(f"⚠️ {title}: 키워드와 무관한 블로그")
-                continue
-
-            print(f"✅ 최종 요약 완료:\n{summary}")
-
-            # ROUGE 계산
-            score = scorer.score(full_text, summary)
-            rouge_scores.append(score)
-
-            print(f"📊 ROUGE-1: {score['rouge1']}")
-            print(f"📊 ROUGE-2: {score['rouge2']}")
-            print(f"📊 ROUGE-L: {score['rougeL']}")
-
-            summarized_articles.append({
-                "title": title,
-                "url": article.get("url"),
-                "summary": summary
-            })
+            outputs = batch_hierarchical_summary(
+                [articles[i]["full_text"] for i in kept_idx], keyword, post_check=RELEVANCE_POST_CHECK
+            )
         except Exception as e:
             print(f"❌ 요약 실패: {e}")
+            outputs = [None] * len(kept_idx)
+        for i, summary in zip(kept_idx, outputs):
+            summaries[i] = summary
+        return summaries
+
+    # ✅ 다운로드와 요약을 겹쳐서 실행하고 완료 순서대로 결과 수집
+    #    재사용한 이전 요약도 개수에 포함 (본문 해시로 도중에 재사용된 기사 포함)
+    summarized_articles = []
+    results = stream_pipeline(all_articles, fetch_article, summarize, accept=accept,
+                              limit=lambda: max(0, NEWS_TOP_K - len(seen.reused)))
+    for idx, (article, full_text, summary) in enumerate(results, 1):
+        title = article.get("title", "")
+
+        if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
+            print(f"\n[{idx}] ⚠️ {title}: 키워드와 무관한 기사")
+            continue
+
+        print(f"\n[{idx}] ✅ 최종 요약 완료:\n{summary}")
+        seen.record(article, item_keys(url=article.get("url"), text=full_text), summary)
+
+        # ROUGE 계산
+        score = scorer.score(full_text, summary)
+        rouge_scores.append(score)
+
+        print(f"📊 ROUGE-1: {score['rouge1']}")
+        print(f"📊 ROUGE-2: {score['rouge2']}")
+        print(f"📊 ROUGE-L: {score['rougeL']}")
+
+        summarized_articles.append({
+            "title": title,
+            "url": article.get("url"),
+            "summary": summary
+        })
+
+    # 최종 평균 ROUGE 계산
+    if rouge_scores:
+        avg_rouge = {}
+        for metric in ['rouge1', 'rouge2', 'rougeL']:
+            avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
+            avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
+            avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
+
+            avg_rouge[metric] = {
+                'precision': avg_precision,
+                'recall': avg_recall,
+                'f1': avg_f1
+            }
+
+        print("\n=== 📈 최종 평균 ROUGE ===")
+        for metric, values in avg_rouge.items():
+            print(
+                f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
+    else:
+        print("❗️ 평가할 요약이 없습니다.")
 
-        # 최종 평균 ROUGE 계산
-        if rouge_scores:
-            avg_rouge = {}
-            for metric in ['rouge1', 'rouge2', 'rougeL']:
-                avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
-                avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
-                avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
-
-                avg_rouge[metric] = {
-                    'precision': avg_precision,
-                    'recall': avg_recall,
-                    'f1': avg_f1
-                }
-
-            print("\n=== 📈 최종 평균 ROUGE ===")
-            for metric, values in avg_rouge.items():
-                print(
-                    f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
-        else:
-            print("❗️ 평가할 요약이 없습니다.")
-
-    return summarized_articles
\ No newline at end of file
+    return seen.reused + summarized_articles
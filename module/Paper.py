@@ -2,13 +2,16 @@ import sys
 sys.path.append("E:\Daily_AI_Briefing_Service")
 
 from function_dev.synonym_finder import find_synonyms
-from function_dev.paper_downloader import download_paper
-from function_dev.papaer_summarizer_connector import summarize_bart
+from function_dev.paper_downloader import download_papers
+from function_dev.papaer_summarizer_connector import summarize_bart_batch, summarize_bart, estimate_bart_seconds
+from function_dev.relevance_filter import prefilter_by_relevance, RELEVANCE_POST_CHECK
+from function_dev.near_duplicate import dedupe_near_duplicates
+from function_dev.seen_store import SeenItemTracker, item_keys
 from rouge_score import rouge_scorer
 import re
 
-def Paper_pipeline(keyword, days, n=1, country='Korea'):
-    keywords = find_synonyms(keyword, n, country)
+def Paper_pipeline(keyword, days, n=1, country='Korea', keywords=None):
+    keywords = keywords or find_synonyms(keyword, n, country)
 
     keywords = [kw for kw in keywords if re.fullmatch(r'[A-Za-z0-9\- ]+', kw)]
 
@@ -19,76 +22,117 @@ def Paper_pipeline(keyword, days, n=1, country='Korea'):
 
     summarized_papers = []
     seen_urls = set()   # ✅ 중복 방지용
+    seen = SeenItemTracker("paper")
 
     scorer = rouge_scorer.RougeScorer(['rouge1', 'rouge2', 'rougeL'], use_stemmer=True)
     rouge_scores = []  # 각 기사별 점수 저장용  
 
-    for keyword in keywords:
-        papers = download_paper(keyword, days)
-        for idx, paper in enumerate(papers, 1):
-            title = paper.get("title", "")
-            full_text = paper.get("body", "").strip()
-            url = paper.get("url")
-
-            if not full_text:
-                print(f"\n[{idx}] ⚠️ {title}: 본문 없음 (스킵)")
-                continue
-
-            # ✅ URL 기준 중복 제거
-            if url in seen_urls:
-                print(f"\n[{idx}] 🚫 {title}: 이미 처리된 논문 (중복 스킵)")
-                continue
-            seen_urls.add(url)
-
-            print(f"\n[{idx}] 📰 {title}")
-            print(f"📄 본문 길이: {len(full_text)}자")
-
+    # ✅ 모든 키워드를 한 번에 검색 (arXiv id 기준 중복 제거) → 사전 필터 → 요약
+    valid_papers = []
+    # ✅ 이전 실행에서 브리핑한 논문(arXiv id 기준)은 PDF/abstract를 다시 처리하지 않음
+    papers = download_papers(
+        keywords, days, skip=lambda paper: seen.check({"title": paper["title"], "url": paper["pdf_url"]},
+                                                      item_keys(arxiv_id=paper["id"]))
+    )
+    for idx, paper in enumerate(papers, 1):
+        title = paper.get("title", "")
+        full_text = paper.get("body", "").strip()
+        url = paper.get("url")
+
+        if not full_text:
+            print(f"\n[{idx}] ⚠️ {title}: 본문 없음 (스킵)")
+            continue
+
+        # ✅ URL 기준 중복 제거
+        if url in seen_urls:
+            print(f"\n[{idx}] 🚫 {title}: 이미 처리된 논문 (중복 스킵)")
+            continue
+        seen_urls.add(url)
+        valid_papers.append((paper.get("keyword", keyword), paper, full_text))
+
+    # ✅ arXiv id가 달라도 본문이 거의 같은 논문(버전 중복 등)은 하나만 남김
+    unique_ids = {id(paper) for paper in dedupe_near_duplicates([paper for _, paper, _ in valid_papers], text_key="body")}
+    valid_papers = [entry for entry in valid_papers if id(entry[1]) in unique_ids]
+
+    # ✅ 요약 전에 키워드와 무관한 논문 제외
+    kept, _ = prefilter_by_relevance(
+        [paper for _, paper, _ in valid_papers], [keyword for keyword, _, _ in valid_papers],
+        threshold=0.1, text_key="body", estimate_seconds=estimate_bart_seconds
+    )
+    kept_ids = {id(paper) for paper in kept}
+    valid_papers = [entry for entry in valid_papers if id(entry[1]) in kept_ids]
+
+    # ✅ 배치 요약이 실패하면 논문별로 다시 요약해 실패한 논문만 제외
+    errors = {}
+    try:
+        summaries = summarize_bart_batch(
+            [full_text for _, _, full_text in valid_papers],
+            [keyword for keyword, _, _ in valid_papers],
+            post_check=RELEVANCE_POST_CHECK
+        )
+    except Exception as e:
+        print(f"❌ 배치 요약 실패 → 논문별로 다시 요약: {e}")
+        summaries = []
+        for i, (keyword, paper, full_text) in enumerate(valid_papers):
             try:
-                summary = summarize_bart(full_text, keyword)
-                if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
-                    print(f"⚠️ {title}: 키워드와 무관한 블로그")
-                    continue
-                
-                print(f"✅ 최종 요약 완료:\n{summary[:500]}...")
-
-                # ROUGE 계산
-                score = scorer.score(full_text, summary)
-                rouge_scores.append(score)
-
-                print(f"📊 ROUGE-1: {score['rouge1']}")
-                print(f"📊 ROUGE-2: {score['rouge2']}")
-                print(f"📊 ROUGE-L: {score['rougeL']}")
-
-                summarized_papers.append({
-                    "title": title,
-                    "url": url,
-                    "summary": summary
-                })
+                summaries.append(summarize_bart(full_text, keyword, post_check=RELEVANCE_POST_CHECK))
             except Exception as e:
-                print(f"❌ 요약 실패: {e}")
-
-            # 최종 평균 ROUGE 계산
-        if rouge_scores:
-            avg_rouge = {}
-            for metric in ['rouge1', 'rouge2', 'rougeL']:
-                avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
-                avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
-                avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
-
-                avg_rouge[metric] = {
-                    'precision': avg_precision,
-                    'recall': avg_recall,
-                    'f1': avg_f1
-                }
-
-            print("\n=== 📈 최종 평균 ROUGE ===")
-            for metric, values in avg_rouge.items():
-                print(
-                    f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
-        else:
-            print("❗️ 평가할 요약이 없습니다.")
-
-    return summarized_papers
+                errors[i] = e
+                summaries.append(None)
+
+    for idx, ((keyword, paper, full_text), summary) in enumerate(zip(valid_papers, summaries), 1):
+        title = paper.get("title", "")
+        url = paper.get("url")
+
+        print(f"\n[{idx}] 📰 {title}")
+        print(f"📄 본문 길이: {len(full_text)}자")
+
+        if idx - 1 in errors:
+            print(f"❌ {title}: 요약 실패: {errors[idx - 1]}")
+            continue
+        if summary is None:  # ✅ 요약 결과가 None인 경우 스킵
+            print(f"⚠️ {title}: 키워드와 무관한 논문")
+            continue
+
+        print(f"✅ 최종 요약 완료:\n{summary[:500]}...")
+        seen.record(paper, item_keys(arxiv_id=paper.get("id"), url=url), summary)
+
+        # ROUGE 계산
+        score = scorer.score(full_text, summary)
+        rouge_scores.append(score)
+
+        print(f"📊 ROUGE-1: {score['rouge1']}")
+        print(f"📊 ROUGE-2: {score['rouge2']}")
+        print(f"📊 ROUGE-L: {score['rougeL']}")
+
+        summarized_papers.append({
+            "title": title,
+            "url": url,
+            "summary": summary
+        })
+
+    # 최종 평균 ROUGE 계산
+    if rouge_scores:
+        avg_rouge = {}
+        for metric in ['rouge1', 'rouge2', 'rougeL']:
+            avg_precision = sum(score[metric].precision for score in rouge_scores) / len(rouge_scores)
+            avg_recall = sum(score[metric].recall for score in rouge_scores) / len(rouge_scores)
+            avg_f1 = sum(score[metric].fmeasure for score in rouge_scores) / len(rouge_scores)
+
+            avg_rouge[metric] = {
+                'precision': avg_precision,
+                'recall': avg_recall,
+                'f1': avg_f1
+            }
+
+        print("\n=== 📈 최종 평균 ROUGE ===")
+        for metric, values in avg_rouge.items():
+            print(
+                f"{metric.upper()}: Precision: {values['precision']:.4f}, Recall: {values['recall']:.4f}, F1: {values['f1']:.4f}")
+    else:
+        print("❗️ 평가할 요약이 없습니다.")
+
+    return seen.reused + summarized_papers
 
 if __name__ == "__main__":
-    print(Paper_pipeline("ai", 3))
\ No newline at end of file
+    print(Paper_pipeline("ai", 3))
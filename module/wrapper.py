@@ -1,19 +1,61 @@
 # module/wrapper.py
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
 from module.News import News_pipeline
 from module.Blogs import Blogs_pipeline
 from module.Paper import Paper_pipeline
+from module.Briefing import Briefing_pipeline
+
+# ✅ 요청별 설정 (웹에서 받은 검색 범위/국가). 동시에 들어온 요청끼리 서로 덮어쓰지 않도록 contextvar로 전달
+#    results에는 요청 중 실행된 파이프라인 결과가 그대로 쌓임 (에이전트 출력 텍스트를 다시 파싱하지 않도록)
+@dataclass(frozen=True)
+class RequestContext:
+    n: int = 1
+    country: str = 'Korea'
+    results: list = field(default_factory=list)
+
+_default_context = RequestContext()
+_request_context = ContextVar("request_context", default=None)
 
 def set_web_params(n, country):
-    global WEB_N, WEB_COUNTRY
-    WEB_N = n
-    WEB_COUNTRY = country
+    # 요청 컨텍스트 밖(agent.py 단독 실행 등)에서 쓰는 기본값
+    global _default_context
+    _default_context = RequestContext(n, country)
+
+@contextmanager
+def request_context(n, country):
+    ctx = RequestContext(n, country)
+    token = _request_context.set(ctx)
+    try:
+        yield ctx
+    finally:
+        _request_context.reset(token)
+
+def current_context():
+    return _request_context.get() or _default_context
+
+def _record(items):
+    # 요청 컨텍스트 안에서 실행된 경우에만 결과 기록
+    ctx = _request_context.get()
+    if ctx is not None:
+        ctx.results.extend(items or [])
+    return items
 
 def News_pipeline_wrapped(keyword, days):
-    return News_pipeline(keyword, days, WEB_N, WEB_COUNTRY)
+    ctx = current_context()
+    return _record(News_pipeline(keyword, days, ctx.n, ctx.country))
 
 def Blogs_pipeline_wrapped(keyword, days):
-    return Blogs_pipeline(keyword, days, WEB_N, WEB_COUNTRY)
+    ctx = current_context()
+    return _record(Blogs_pipeline(keyword, days, ctx.n, ctx.country))
 
 def Paper_pipeline_wrapped(keyword, days):
-    return Paper_pipeline(keyword, days, WEB_N, WEB_COUNTRY)
+    ctx = current_context()
+    return _record(Paper_pipeline(keyword, days, ctx.n, ctx.country))
+
+def Briefing_pipeline_wrapped(keyword, days):
+    ctx = current_context()
+    return _record(Briefing_pipeline(keyword, days, ctx.n, ctx.country))